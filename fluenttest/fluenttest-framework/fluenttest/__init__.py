@@ -16,7 +16,7 @@
 
 from .nl_ui_locator import FluentDriver
 from .runtime_parser import QueryParser
-from .test_suite import FluentTestSuite
+from .test_suite import FluentTestSuite, TestResult
 
 __version__ = "1.0.0"
 __author__ = "FluentTest Team"
@@ -24,5 +24,6 @@ __author__ = "FluentTest Team"
 __all__ = [
     "FluentDriver",
     "QueryParser", 
-    "FluentTestSuite"
+    "FluentTestSuite",
+    "TestResult"
 ]
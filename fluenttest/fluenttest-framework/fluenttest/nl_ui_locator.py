@@ -2,25 +2,218 @@
 # ======================================
 # Core module for converting natural language queries into dynamic Appium locators.
 
+import io
 import re
-import json
+import sys
+import functools
+import time
 import logging
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
-import difflib
-from concurrent.futures import ThreadPoolExecutor
-import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+# lxml parses page source in C; the stdlib parser exposes the same API for what we use
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# Strategy checks as compiled, parameterised XPath so lxml evaluates them in C;
+# each mirrors _node_matches and returns the first displayed hit in document order
+if HAS_LXML:
+    _DISPLAYED = "[not(@displayed) or @displayed='true']"
+    _COMPILED_CHECKS = {
+        ('texts', True): ET.XPath(f"(//*[string(@text)=$value]{_DISPLAYED})[1]"),
+        ('texts', False): ET.XPath(f"(//*[contains(string(@text), $value)]{_DISPLAYED})[1]"),
+        ('content_descs', True): ET.XPath(f"(//*[string(@content-desc)=$value]{_DISPLAYED})[1]"),
+        ('content_descs', False): ET.XPath(f"(//*[contains(string(@content-desc), $value)]{_DISPLAYED})[1]"),
+        ('class_names', True): ET.XPath(f"(//*[@class=$value or (not(@class) and name()=$value)]{_DISPLAYED})[1]"),
+        ('class_names', False): ET.XPath(
+            f"(//*[contains(@class, $value) or (not(@class) and contains(name(), $value))]{_DISPLAYED})[1]")
+    }
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for tokenizing queries and pulling text content out of them
+_WORD_RE = re.compile(r'\w+')
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"]*)"')
+_SINGLE_QUOTED_RE = re.compile(r"'([^']*)'")
+_CONTENT_PATTERNS = [
+    re.compile(r'with\s+text\s+["\']*([^"\']+)["\']*', re.IGNORECASE),
+    re.compile(r'containing\s+["\']*([^"\']+)["\']*', re.IGNORECASE),
+    re.compile(r'labeled\s+["\']*([^"\']+)["\']*', re.IGNORECASE),
+    re.compile(r'says\s+["\']*([^"\']+)["\']*', re.IGNORECASE)
+]
+
+
+def _node_value(node: ET.Element, column: str) -> str:
+    """Read the page source attribute backing an ElementTable column"""
+    if column == 'class_names':
+        return node.get('class', node.tag)
+    return node.get('content-desc' if column == 'content_descs' else 'text', '')
+
+
+# Attributes compared between a snapshot node and the live element its XPath resolves to
+_IDENTITY_ATTRIBUTES = ('text', 'content-desc', 'resource-id')
+
+
+def _node_identity(node: ET.Element) -> Tuple[str, ...]:
+    """Read the attributes that tell a snapshot node apart from whatever replaced it at the same XPath"""
+    return tuple(node.get(name, '') for name in _IDENTITY_ATTRIBUTES)
+
+
+def _node_matches(node: ET.Element, check: Tuple[str, str, bool]) -> bool:
+    """Evaluate a (column, value, exact) strategy check against a single page source node"""
+    column, value, exact = check
+    node_value = _node_value(node, column)
+    return node_value == value if exact else value in node_value
+
+
+def _iter_with_xpath(root: ET.Element):
+    """Walk a page source tree in document order, yielding each node with its absolute XPath"""
+    stack = [(root, f'/{root.tag}')]
+    while stack:
+        node, xpath = stack.pop()
+        yield node, xpath
+        
+        # XPath positions are 1-based and counted per tag among siblings
+        children = []
+        positions = {}
+        for child in node:
+            if not isinstance(child.tag, str):
+                continue  # lxml yields comments and processing instructions as children
+            positions[child.tag] = positions.get(child.tag, 0) + 1
+            children.append((child, f'{xpath}/{child.tag}[{positions[child.tag]}]'))
+        stack.extend(reversed(children))
+
+
+def _iterparse_with_xpath(source: str):
+    """Stream page source nodes in document order with their absolute XPaths, without keeping the tree"""
+    # Each open element keeps its XPath and per-tag child counts for sibling positions
+    stack = []
+    for event, node in ET.iterparse(io.BytesIO(source.encode('utf-8')), events=('start', 'end')):
+        if event == 'start':
+            if stack:
+                parent_xpath, positions = stack[-1]
+                positions[node.tag] = positions.get(node.tag, 0) + 1
+                xpath = f'{parent_xpath}/{node.tag}[{positions[node.tag]}]'
+            else:
+                xpath = f'/{node.tag}'
+            stack.append((xpath, {}))
+            yield node, xpath
+        else:
+            stack.pop()
+            node.clear()
+
+
+class ElementTable:
+    """Displayed nodes of a parsed page source, searchable by strategy check"""
+    __slots__ = ('root', 'xpaths', 'nodes', 'texts', 'content_descs', 'class_names')
+    
+    def __init__(self, root: ET.Element):
+        self.root = root
+        # Column lists are only built for the stdlib parser; lxml runs compiled XPath instead
+        self.xpaths = None
+    
+    def _build_columns(self):
+        """Store the displayed nodes column-wise, one list per matched attribute"""
+        self.xpaths = []
+        self.nodes = []
+        self.texts = []
+        self.content_descs = []
+        self.class_names = []
+        for node, xpath in _iter_with_xpath(self.root):
+            if node.get('displayed', 'true') != 'true':
+                continue
+            self.xpaths.append(xpath)
+            self.nodes.append(node)
+            self.texts.append(_node_value(node, 'texts'))
+            self.content_descs.append(_node_value(node, 'content_descs'))
+            self.class_names.append(_node_value(node, 'class_names'))
+    
+    def first_match(self, check: Tuple[str, str, bool]) -> Optional[Tuple[str, ET.Element]]:
+        """Return the XPath and node of the first displayed node in document order passing a strategy check"""
+        column, value, exact = check
+        if HAS_LXML:
+            found = _COMPILED_CHECKS[column, exact](self.root, value=value)
+            return (self.root.getroottree().getpath(found[0]), found[0]) if found else None
+        
+        if self.xpaths is None:
+            self._build_columns()
+        values = getattr(self, column)
+        if exact:
+            # Exact matches scan the column in C instead of testing nodes one by one
+            try:
+                row = values.index(value)
+            except ValueError:
+                return None
+        else:
+            row = next((row for row, node_value in enumerate(values) if value in node_value), None)
+            if row is None:
+                return None
+        return self.xpaths[row], self.nodes[row]
+
+
+# Locator templates for text hints, filled with str.format per quoted text
+_TEXT_STRATEGY_TEMPLATES = (
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("{}")', 'texts', True),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("{}")', 'texts', False),
+    (AppiumBy.ACCESSIBILITY_ID, '{}', 'content_descs', True),
+    (AppiumBy.XPATH, "//*[@text='{}']", 'texts', True),
+    (AppiumBy.XPATH, "//*[contains(@text, '{}')]", 'texts', False)
+)
+
+# Widget class strategies do not depend on the query text
+_BUTTON_STRATEGIES = tuple(
+    (locator_type, locator_value, ('class_names', "android.widget.Button", True))
+    for locator_type, locator_value in (
+        (AppiumBy.XPATH, "//android.widget.Button"),
+        (AppiumBy.CLASS_NAME, "android.widget.Button"),
+        (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.Button")')
+    )
+)
+_EDIT_TEXT_STRATEGIES = tuple(
+    (locator_type, locator_value, ('class_names', "android.widget.EditText", True))
+    for locator_type, locator_value in (
+        (AppiumBy.XPATH, "//android.widget.EditText"),
+        (AppiumBy.CLASS_NAME, "android.widget.EditText"),
+        (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.EditText")')
+    )
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_strategies(texts: Tuple[str, ...], button: bool,
+                      edit_text: bool) -> Tuple[Tuple[str, str, Tuple[str, str, bool]], ...]:
+    """Build the ordered locator strategies for one query shape; each carries its Appium
+    locator plus an equivalent (column, value, exact) check on the page source"""
+    strategies = []
+    
+    # Strategy 1: Text-based search
+    for text in texts:
+        strategies.extend((locator_type, template.format(text), (column, text, exact))
+                          for locator_type, template, column, exact in _TEXT_STRATEGY_TEMPLATES)
+    
+    # Strategy 2: Content description search
+    if button:
+        strategies.extend(_BUTTON_STRATEGIES)
+    if edit_text:
+        strategies.extend(_EDIT_TEXT_STRATEGIES)
+    
+    return tuple(strategies)
+
 
 class LocatorType(Enum):
     """Supported locator types for element identification"""
@@ -32,7 +225,7 @@ class LocatorType(Enum):
     ANDROID_VIEWTAG = "android viewtag"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UIElement:
     """Represents a UI element with its properties and locator information"""
     tag: str
@@ -78,6 +271,7 @@ class UIElement:
 
 class NaturalLanguageProcessor:
     """Processes natural language queries and matches them to UI elements"""
+    __slots__ = ('action_keywords', 'element_keywords', '_actions', '_action_rank_by_keyword')
     
     def __init__(self):
         self.action_keywords = {
@@ -102,46 +296,50 @@ class NaturalLanguageProcessor:
             'tab': ['tab', 'tabs', 'tabhost'],
             'dialog': ['dialog', 'popup', 'modal', 'alert']
         }
+        
+        # Reverse index so a query is tokenized once and each word is a single lookup.
+        # Keywords map to the rank of their action in the table, which doubles as precedence
+        self._actions = list(self.action_keywords)
+        self._action_rank_by_keyword = {}
+        for rank, keywords in enumerate(self.action_keywords.values()):
+            for keyword in keywords:
+                self._action_rank_by_keyword.setdefault(keyword, rank)
     
     def extract_action(self, query: str) -> str:
         """Extract action from natural language query"""
-        query_lower = query.lower()
+        # map/set keep the per-word lookups in C rather than a Python-level loop
+        ranks = set(map(self._action_rank_by_keyword.get, _WORD_RE.findall(query.lower())))
+        ranks.discard(None)
         
-        for action, keywords in self.action_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                return action
+        if ranks:
+            # Keep the keyword table order as precedence when several actions match
+            return self._actions[min(ranks)]
         
         return 'click'  # Default action
     
     def extract_text_content(self, query: str) -> List[str]:
         """Extract quoted text or specific content from query"""
         # Find text in quotes
-        quoted_text = re.findall(r'"([^"]*)"', query)
-        quoted_text.extend(re.findall(r"'([^']*)'", query))
+        quoted_text = _DOUBLE_QUOTED_RE.findall(query)
+        quoted_text.extend(_SINGLE_QUOTED_RE.findall(query))
         
         if quoted_text:
             return quoted_text
         
         # Extract potential text content
-        content_patterns = [
-            r'with\s+text\s+["\']*([^"\']+)["\']*',
-            r'containing\s+["\']*([^"\']+)["\']*',
-            r'labeled\s+["\']*([^"\']+)["\']*',
-            r'says\s+["\']*([^"\']+)["\']*'
-        ]
-        
         extracted_text = []
-        for pattern in content_patterns:
-            matches = re.findall(pattern, query, re.IGNORECASE)
-            extracted_text.extend(matches)
+        for pattern in _CONTENT_PATTERNS:
+            extracted_text.extend(pattern.findall(query))
         
         return extracted_text
 
 
 class FluentDriver:
     """Main FluentTest driver for natural language UI automation"""
+    __slots__ = ('driver', 'timeout', 'wait', 'nlp', 'element_cache', 'page_source_cache',
+                 '_element_table', 'cache_ttl', '_cached_at', '_frozen')
     
-    def __init__(self, appium_driver, timeout: int = 10):
+    def __init__(self, appium_driver, timeout: int = 10, cache_ttl: Optional[float] = 2.0):
         self.driver = appium_driver
         self.timeout = timeout
         self.wait = WebDriverWait(appium_driver, timeout)
@@ -150,19 +348,38 @@ class FluentDriver:
         # Cache for performance
         self.element_cache = {}
         self.page_source_cache = None
+        self._element_table = None
+        
+        # Screens can change without an action of ours (animations, async loads), so
+        # cached lookups expire after cache_ttl seconds; None keeps them until invalidated
+        self.cache_ttl = cache_ttl
+        self._cached_at = None
+        # Depth of nested frozen_source() blocks; while positive the snapshot does not expire
+        self._frozen = 0
         
     def find(self, query: str) -> Optional[WebElement]:
         """Find element using natural language query"""
+        if (not self._frozen and self._cached_at is not None and self.cache_ttl is not None
+                and time.monotonic() - self._cached_at > self.cache_ttl):
+            self.invalidate_cache()
+        if self._cached_at is None:
+            self._cached_at = time.monotonic()
+        
+        # Same query on an unchanged screen resolves to the same element
+        cached = self.element_cache.get(query)
+        if cached is not None:
+            return cached
+        
         try:
-            # Extract action and text content
-            action = self.nlp.extract_action(query)
+            # Extract text content; the action is up to the caller (click, type_text, ...)
             text_content = self.nlp.extract_text_content(query)
             
             # Try different locator strategies
-            element = self._try_locator_strategies(query, text_content)
+            element = self._try_locator_strategies(query.lower(), text_content)
             
             if element:
                 logger.info(f"Found element for: {query}")
+                self.element_cache[query] = element
                 return element
             else:
                 logger.warning(f"Element not found for: {query}")
@@ -172,55 +389,139 @@ class FluentDriver:
             logger.error(f"Error finding element for '{query}': {e}")
             return None
     
-    def _try_locator_strategies(self, query: str, text_content: List[str]) -> Optional[WebElement]:
+    def _try_locator_strategies(self, query_lower: str, text_content: List[str]) -> Optional[WebElement]:
         """Try different locator strategies to find element"""
-        strategies = []
-        
-        # Strategy 1: Text-based search
-        if text_content:
-            for text in text_content:
-                strategies.extend([
-                    (AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{text}")'),
-                    (AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().textContains("{text}")'),
-                    (AppiumBy.ACCESSIBILITY_ID, text),
-                    (AppiumBy.XPATH, f"//*[@text='{text}']"),
-                    (AppiumBy.XPATH, f"//*[contains(@text, '{text}')]")
-                ])
-        
-        # Strategy 2: Content description search
-        if 'button' in query.lower():
-            strategies.extend([
-                (AppiumBy.XPATH, "//android.widget.Button"),
-                (AppiumBy.CLASS_NAME, "android.widget.Button"),
-                (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.Button")')
-            ])
-        
-        if 'input' in query.lower() or 'field' in query.lower():
-            strategies.extend([
-                (AppiumBy.XPATH, "//android.widget.EditText"),
-                (AppiumBy.CLASS_NAME, "android.widget.EditText"),
-                (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.EditText")')
-            ])
-        
-        # Try each strategy
-        for locator_type, locator_value in strategies:
+        # Strategies only depend on the query shape, so common queries reuse a cached tuple
+        strategies = _build_strategies(tuple(text_content), 'button' in query_lower,
+                                       'input' in query_lower or 'field' in query_lower)
+        
+        # Match against one page source snapshot instead of a server round-trip per strategy
+        if self._get_page_source() is not None:
             try:
-                element = self.driver.find_element(locator_type, locator_value)
-                if element and element.is_displayed():
+                # A text hint usually matches early, so stream the source instead of building the whole
+                # tree; lxml parses and runs the compiled checks in C, which beats a Python-level stream
+                element = self._find_in_page_source(strategies, stream=bool(text_content) and not HAS_LXML)
+                if element is not None:
                     return element
-            except NoSuchElementException:
-                continue
-            except Exception as e:
-                logger.debug(f"Strategy failed {locator_type}={locator_value}: {e}")
-                continue
+                # The snapshot only checks text, content-desc and class; the server can still match
+                # other attributes (iOS name/label, WebView contexts)
+                logger.debug("No match in page source, probing strategies on the server")
+            except ET.ParseError as e:
+                logger.debug(f"Could not parse page source, probing strategies on the server: {e}")
+        
+        # Probe one strategy at a time in priority order: Appium runs a session's commands one after
+        # another, so concurrent probes would only queue up behind each other and the first hit
+        # Repeated text hints produce identical locators, which only need one round-trip
+        locators = dict.fromkeys((locator_type, locator_value) for locator_type, locator_value, _ in strategies)
+        for locator_type, locator_value in locators:
+            element = self._probe_strategy(locator_type, locator_value)
+            if element:
+                return element
         
         return None
     
+    def _probe_strategy(self, locator_type: str, locator_value: str) -> Optional[WebElement]:
+        """Look up a single locator on the server, returning None on a miss"""
+        try:
+            # find_elements answers a miss with an empty list, sparing the server error
+            # response and the NoSuchElementException raised for it on every missed strategy
+            elements = self.driver.find_elements(locator_type, locator_value)
+            if elements and elements[0].is_displayed():
+                return elements[0]
+        except Exception as e:
+            logger.debug(f"Strategy failed {locator_type}={locator_value}: {e}")
+        return None
+    
+    def _get_page_source(self) -> Optional[str]:
+        """Return the page source, fetching it only when the cache is empty"""
+        if self.page_source_cache is None:
+            try:
+                self.page_source_cache = self.driver.page_source
+            except Exception as e:
+                logger.debug(f"Page source unavailable, probing strategies on the server: {e}")
+                return None
+        return self.page_source_cache
+    
+    def _find_in_page_source(self, strategies: Tuple[Tuple[str, str, Tuple[str, str, bool]], ...],
+                             stream: bool) -> Optional[WebElement]:
+        """Pick the first displayed node matching a strategy and resolve it with a single lookup"""
+        best_xpath = None
+        # Streamed nodes are cleared once parsed, so the identity is read when the node matches
+        best_identity = None
+        if stream and self._element_table is None:
+            # Lowest strategy index wins, then document order; an exact hit on the
+            # first strategy cannot be beaten so the scan stops there
+            best_index = len(strategies)
+            for node, xpath in _iterparse_with_xpath(self.page_source_cache):
+                if node.get('displayed', 'true') != 'true':
+                    continue
+                for index in range(best_index):
+                    if _node_matches(node, strategies[index][2]):
+                        best_index, best_xpath, best_identity = index, xpath, _node_identity(node)
+                        break
+                if best_index == 0:
+                    break
+        else:
+            if self._element_table is None:
+                # Parse bytes: lxml refuses str input carrying an XML encoding declaration
+                root = ET.fromstring(self.page_source_cache.encode('utf-8'))
+                self._element_table = ElementTable(root)
+            # Same ordering as the streamed scan, one column search per strategy
+            for _, _, check in strategies:
+                found = self._element_table.first_match(check)
+                if found is not None:
+                    best_xpath, best_identity = found[0], _node_identity(found[1])
+                    break
+        
+        if best_xpath is None:
+            return None
+        
+        try:
+            element = self.driver.find_element(AppiumBy.XPATH, best_xpath)
+        except NoSuchElementException:
+            # Screen changed since the snapshot was taken
+            self.invalidate_cache()
+            return None
+        
+        # The screen may have changed without going through click/type_text (a direct element.click(),
+        # an async load), and then the positional XPath lands on a different element of the new screen
+        if not self._matches_identity(element, best_identity):
+            logger.debug(f"Element at {best_xpath} no longer matches the page source snapshot")
+            self.invalidate_cache()
+            return None
+        return element
+    
+    def _matches_identity(self, element: WebElement, identity: Tuple[str, ...]) -> bool:
+        """Check a live element against the identifying attributes of its snapshot node"""
+        try:
+            return all((element.get_attribute(name) or '') == value
+                       for name, value in zip(_IDENTITY_ATTRIBUTES, identity))
+        except WebDriverException as e:
+            logger.debug(f"Could not read element attributes: {e}")
+            return False
+    
+    @contextmanager
+    def frozen_source(self):
+        """Keep the current page source snapshot for a block of lookups that do not change the screen"""
+        self._frozen += 1
+        try:
+            yield self
+        finally:
+            self._frozen -= 1
+    
+    def invalidate_cache(self):
+        """Drop the cached page source so the next lookup sees the current screen"""
+        self.element_cache.clear()
+        self.page_source_cache = None
+        self._element_table = None
+        self._cached_at = None
+    
     def click(self, query: str) -> bool:
         """Click element found by natural language query"""
         element = self.find(query)
         if element:
             element.click()
+            self.invalidate_cache()
             return True
         return False
     
@@ -228,8 +529,13 @@ class FluentDriver:
         """Type text into field found by natural language query"""
         element = self.find(field_query)
         if element:
-            element.clear()
-            element.send_keys(text)
+            try:
+                # Clear and type in one server round-trip on UiAutomator2
+                self.driver.execute_script('mobile: replaceElementValue', {'elementId': element.id, 'text': text})
+            except WebDriverException:
+                element.clear()
+                element.send_keys(text)
+            self.invalidate_cache()
             return True
         return False
     
@@ -237,14 +543,41 @@ class FluentDriver:
         """Wait for element to appear"""
         timeout = timeout or self.timeout
         
+        def poll(driver):
+            # Every poll needs a fresh snapshot, the screen is expected to change
+            self.invalidate_cache()
+            return self.find(query)
+        
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                lambda driver: self.find(query)
-            )
+            # Reuse the driver-wide wait unless a custom timeout was asked for
+            wait = self.wait if timeout == self.timeout else WebDriverWait(self.driver, timeout)
+            return wait.until(poll)
         except TimeoutException:
             logger.warning(f"Element not found within {timeout} seconds: {query}")
             return None
     
+    def wait_until_idle(self, timeout: float = 1.0, interval: float = 0.05) -> bool:
+        """Wait until the screen stops changing, i.e. two consecutive page sources are identical"""
+        deadline = time.monotonic() + timeout
+        previous = None
+        while True:
+            try:
+                source = self.driver.page_source
+            except Exception as e:
+                logger.debug(f"Page source unavailable while waiting for idle: {e}")
+                return False
+            
+            if source == previous:
+                # Not kept as the snapshot: right after an action both sources may still show the
+                # old screen, before the transition has started
+                self.invalidate_cache()
+                return True
+            
+            if time.monotonic() >= deadline:
+                return False
+            previous = source
+            time.sleep(interval)
+    
     def is_present(self, query: str) -> bool:
         """Check if element is present"""
         return self.find(query) is not None
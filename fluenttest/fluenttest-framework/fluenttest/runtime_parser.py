@@ -3,15 +3,38 @@
 # Advanced query processing engine for natural language patterns.
 
 import re
-import json
+import functools
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Any
 from dataclasses import dataclass
 from enum import Enum
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared by every QueryParser
+_CONDITIONAL_RE = re.compile(r'\bif\b|\bwhen\b|\bunless\b')
+_SEQUENCE_RE = re.compile(r'\bthen\b|\bafter\b|\bnext\b')
+_DESCRIPTIVE_RE = re.compile(r'\bcontaining\b|\bwith\b|\bthat\b')
+_QUOTED_RE = re.compile(r'"([^"]*)"')
+_WAIT_TIME_RE = re.compile(r'wait\s+(\d+)\s*(?:second|sec)')
+_IF_THEN_RE = re.compile(r'if\s+(.+?)\s+then')
+
+
+def _compile_first_match(patterns: Dict[str, re.Pattern]) -> re.Pattern:
+    """Fold an ordered pattern table into one regex naming the first entry found anywhere in a query"""
+    # Each alternative is a lookahead tried at position 0 in table order, so the
+    # result matches a loop of re.search calls while running as a single match
+    return re.compile('|'.join(f'(?P<{name}>(?=[\\s\\S]*?(?:{pattern.pattern})))'
+                               for name, pattern in patterns.items()))
+
+
+# Substring fallback for queries no action pattern recognises, in precedence order
+_FALLBACK_ACTION_RE = _compile_first_match({
+    'click': re.compile(r'click|tap|press'),
+    'type': re.compile(r'type|enter|input'),
+    'scroll': re.compile(r'scroll|swipe')
+})
+
 
 class QueryType(Enum):
     """Types of natural language queries"""
@@ -25,6 +48,9 @@ class QueryType(Enum):
 @dataclass
 class ParsedQuery:
     """Parsed natural language query with structured information"""
+    __slots__ = ('original_query', 'query_type', 'action', 'target_element', 'modifiers',
+                 'conditions', 'confidence')
+    
     original_query: str
     query_type: QueryType
     action: str
@@ -36,24 +62,48 @@ class ParsedQuery:
 
 class QueryParser:
     """Advanced natural language query parser"""
+    __slots__ = ('action_patterns', 'element_patterns', '_action_re', '_element_re', '_parse_cached')
     
     def __init__(self):
         self.action_patterns = {
-            'click': r'(?:click|tap|press|select)\s+(.+)',
-            'type': r'(?:type|enter|input)\s+"([^"]+)"\s+(?:in|into)\s+(.+)',
-            'scroll': r'(?:scroll|swipe)\s+(up|down|left|right)',
-            'wait': r'wait\s+(?:for\s+)?(.+)',
-            'verify': r'(?:verify|check|assert)\s+(?:that\s+)?(.+)'
+            'click': re.compile(r'(?:click|tap|press|select)\s+(.+)'),
+            'type': re.compile(r'(?:type|enter|input)\s+"([^"]+)"\s+(?:in|into)\s+(.+)'),
+            'scroll': re.compile(r'(?:scroll|swipe)\s+(up|down|left|right)'),
+            'wait': re.compile(r'wait\s+(?:for\s+)?(.+)'),
+            'verify': re.compile(r'(?:verify|check|assert)\s+(?:that\s+)?(.+)')
         }
         
         self.element_patterns = {
-            'button': r'(?:button|btn)(?:\s+(?:with|containing|labeled)\s+"([^"]+)")?',
-            'input': r'(?:input|field|textbox)(?:\s+(?:with|containing|labeled)\s+"([^"]+)")?',
-            'text': r'(?:text|label)(?:\s+(?:with|containing|saying)\s+"([^"]+)")?'
+            'button': re.compile(r'(?:button|btn)(?:\s+(?:with|containing|labeled)\s+"([^"]+)")?'),
+            'input': re.compile(r'(?:input|field|textbox)(?:\s+(?:with|containing|labeled)\s+"([^"]+)")?'),
+            'text': re.compile(r'(?:text|label)(?:\s+(?:with|containing|saying)\s+"([^"]+)")?')
         }
+        
+        self._action_re = _compile_first_match(self.action_patterns)
+        self._element_re = _compile_first_match(self.element_patterns)
+        
+        # Parsing is deterministic, so repeated queries are served from a per-parser memo
+        self._parse_cached = functools.lru_cache(maxsize=512)(self._parse)
     
     def parse(self, query: str) -> ParsedQuery:
         """Parse natural language query"""
+        # Callers may adjust the parsed dicts, so each one gets its own copy of the memoized result;
+        # they only hold strings and numbers, so rebuilding the containers is enough
+        cached = self._parse_cached(query)
+        target = cached.target_element
+        return ParsedQuery(
+            original_query=cached.original_query,
+            query_type=cached.query_type,
+            action=cached.action,
+            target_element={**target, 'text_content': list(target['text_content']),
+                            'attributes': dict(target['attributes'])},
+            modifiers=dict(cached.modifiers),
+            conditions=[dict(condition) for condition in cached.conditions],
+            confidence=cached.confidence
+        )
+    
+    def _parse(self, query: str) -> ParsedQuery:
+        """Parse a query without consulting the memo"""
         query = query.strip().lower()
         
         # Determine query type
@@ -86,30 +136,26 @@ class QueryParser:
     
     def _classify_query(self, query: str) -> QueryType:
         """Classify the type of query"""
-        if re.search(r'\bif\b|\bwhen\b|\bunless\b', query):
+        if _CONDITIONAL_RE.search(query):
             return QueryType.CONDITIONAL
-        elif re.search(r'\bthen\b|\bafter\b|\bnext\b', query):
+        elif _SEQUENCE_RE.search(query):
             return QueryType.SEQUENCE
-        elif re.search(r'\bcontaining\b|\bwith\b|\bthat\b', query):
+        elif _DESCRIPTIVE_RE.search(query):
             return QueryType.DESCRIPTIVE
         else:
             return QueryType.SIMPLE_ACTION
     
     def _extract_action(self, query: str) -> str:
         """Extract the main action from query"""
-        for action, pattern in self.action_patterns.items():
-            if re.search(pattern, query):
-                return action
-        
-        # Default action detection
-        if any(word in query for word in ['click', 'tap', 'press']):
-            return 'click'
-        elif any(word in query for word in ['type', 'enter', 'input']):
-            return 'type'
-        elif any(word in query for word in ['scroll', 'swipe']):
-            return 'scroll'
-        else:
-            return 'click'  # Default
+        match = self._action_re.match(query)
+        if match:
+            return match.lastgroup
+        
+        # Default action detection, one match instead of a substring scan per keyword
+        match = _FALLBACK_ACTION_RE.match(query)
+        if match:
+            return match.lastgroup
+        return 'click'  # Default
     
     def _extract_target_element(self, query: str) -> Dict[str, Any]:
         """Extract target element information"""
@@ -120,15 +166,14 @@ class QueryParser:
         }
         
         # Extract quoted text
-        quoted_text = re.findall(r'"([^"]*)"', query)
+        quoted_text = _QUOTED_RE.findall(query)
         if quoted_text:
             target['text_content'] = quoted_text
         
         # Extract element type
-        for element_type, pattern in self.element_patterns.items():
-            if re.search(pattern, query):
-                target['element_type'] = element_type
-                break
+        match = self._element_re.match(query)
+        if match:
+            target['element_type'] = match.lastgroup
         
         return target
     
@@ -143,7 +188,7 @@ class QueryParser:
             modifiers['speed'] = 'fast'
         
         # Extract wait times
-        wait_match = re.search(r'wait\s+(\d+)\s*(?:second|sec)', query)
+        wait_match = _WAIT_TIME_RE.search(query)
         if wait_match:
             modifiers['wait_time'] = int(wait_match.group(1))
         
@@ -154,7 +199,7 @@ class QueryParser:
         conditions = []
         
         # Look for conditional patterns
-        if_match = re.search(r'if\s+(.+?)\s+then', query)
+        if_match = _IF_THEN_RE.search(query)
         if if_match:
             conditions.append({
                 'type': 'if',
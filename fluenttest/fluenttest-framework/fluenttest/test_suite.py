@@ -2,11 +2,20 @@
 # ====================
 # Comprehensive test framework for natural language UI automation.
 
-import unittest
+import os
+import sys
 import time
+import functools
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import queue
+import tempfile
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 import json
 from datetime import datetime
 
@@ -14,42 +23,256 @@ from appium import webdriver
 from appium.options.android import UiAutomator2Options
 from selenium.common.exceptions import WebDriverException
 
+# Faster JSON results output when orjson is available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .nl_ui_locator import FluentDriver
 from .runtime_parser import QueryParser
 
 logger = logging.getLogger(__name__)
 
+# Background writer for HTML reports, so teardown can run while the file is written
+_REPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+def _write_report(filename: str, content: bytes):
+    """Write an encoded report to disk"""
+    with open(filename, 'wb') as f:
+        f.write(content)
+    
+    logger.info(f"Report generated: {filename}")
+
+
+def _field_query(query: str) -> str:
+    """Return the field a type query points at, i.e. whatever follows its last ' in ' / ' into '"""
+    # Only look past the quoted text, which may contain ' in ' itself
+    tail = query[query.rfind('"') + 1:]
+    _, sep, field_query = tail.rpartition(' in ')
+    if not sep:
+        _, sep, field_query = tail.rpartition(' into ')
+    return field_query.strip() if sep else 'input field'
+
+
+# UiAutomator2 settings applied once per session: a compressed hierarchy of visible views
+# and short idle/acknowledgement waits make every lookup and action cheaper on the device
+_DRIVER_SETTINGS = {
+    'ignoreUnimportantViews': True,
+    'allowInvisibleElements': False,
+    'waitForIdleTimeout': 100,
+    'waitForSelectorTimeout': 5000,
+    'actionAcknowledgmentTimeout': 100,
+    'keyInjectionDelay': 0
+}
+
+# Fixed steps of the built-in flows; run values are substituted into the {placeholders}
+_LOGIN_STEPS = (
+    'type "{username}" in username field',
+    'type "{password}" in password field',
+    'click login button'
+)
+_SEARCH_STEPS = (
+    'click search button',
+    'type "{search_term}" in search field',
+    'click search or press enter'
+)
+
+# WebdriverIO script run by the Appium server for a batch of (element id, text) steps; a null
+# text is a click. Returns the index of the first failing step, or -1 when all succeed
+_BATCH_SCRIPT = """
+const steps = %s;
+for (let i = 0; i < steps.length; i++) {
+    const [elementId, text] = steps[i];
+    try {
+        if (text === null) {
+            await driver.elementClick(elementId);
+        } else {
+            await driver.elementClear(elementId);
+            await driver.elementSendKeys(elementId, text);
+        }
+    } catch (e) {
+        return i;
+    }
+}
+return -1;
+"""
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class TestResult:
+    """Outcome of a single test run through FluentTestSuite.test_context"""
+    __test__ = False  # not a pytest test class despite the name
+    
+    test_name: str
+    start_wall: float
+    success: bool = False
+    error: Optional[str] = None
+    duration: float = 0.0
+    queries_used: List[str] = field(default_factory=list)
+    # Replayed from the result cache instead of run on the device
+    cached: bool = False
+    
+    @property
+    def start_time(self) -> str:
+        """ISO timestamp of the start, formatted only when someone asks for it"""
+        return datetime.fromtimestamp(self.start_wall).isoformat()
+
+
+# Static page head and summary of the HTML report, filled with format_map per report
+_REPORT_HEADER_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>FluentTest Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        .header {{ background: #f0f8ff; padding: 20px; border-radius: 5px; }}
+        .summary {{ display: flex; gap: 20px; margin: 20px 0; }}
+        .stat {{ background: #e8f4f8; padding: 15px; border-radius: 5px; text-align: center; }}
+        .test {{ margin: 10px 0; padding: 15px; border-radius: 5px; }}
+        .passed {{ background: #d4edda; }}
+        .failed {{ background: #f8d7da; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>FluentTest Report</h1>
+        <p>Generated: {generated}</p>
+        <p>App: {app_package}</p>
+    </div>
+    
+    <div class="summary">
+        <div class="stat">
+            <h3>Total Tests</h3>
+            <h2>{total_tests}</h2>
+        </div>
+        <div class="stat">
+            <h3>Passed</h3>
+            <h2 style="color: green;">{passed_tests}</h2>
+        </div>
+        <div class="stat">
+            <h3>Success Rate</h3>
+            <h2>{success_rate}%</h2>
+        </div>
+    </div>
+    
+    <h2>Test Results</h2>"""
+
+# Report block for a single test, filled with format_map per result
+_REPORT_TEST_TEMPLATE = """
+            <div class="test {status}">
+                <h3>{test_name} - {status_text}</h3>
+                <p>Duration: {duration:.2f}s</p>
+                <p>Queries: {queries}</p>
+                {error}
+            </div>
+            """
+
 
 class FluentTestSuite:
     """Complete test suite using natural language UI automation"""
     
-    def __init__(self, app_package: str, app_activity: str, device_name: str = "emulator-5554"):
+    # Parsing is stateless, so suites share one parser (and its memo), built on first use
+    _shared_parser = None
+    
+    def __init__(self, app_package: str, app_activity: str, device_name: str = "emulator-5554",
+                 max_results: Optional[int] = None, result_cache_dir: Optional[str] = None,
+                 app_build: str = ""):
         self.app_package = app_package
         self.app_activity = app_activity
         self.device_name = device_name
         self.driver = None
         self.fluent = None
-        self.parser = QueryParser()
-        self.test_results = []
+        self._parser = None
+        
+        # Steps repeat across tests and runs, so each distinct query is routed once
+        self._route = functools.lru_cache(maxsize=1024)(self._build_route)
         
-        # Test configuration
-        self.capabilities = {
+        # Oldest results are dropped once max_results is reached; None keeps every run
+        self.test_results = deque(maxlen=max_results)
+        self._report_future = None
+        
+        # Passed runs are stored here and replayed when the same steps run against the same
+        # build again; app_build (e.g. versionCode or APK hash) keeps a new build from reusing them
+        if result_cache_dir is not None and not app_build:
+            raise ValueError("app_build is required when result_cache_dir is set")
+        self.result_cache_dir = result_cache_dir
+        self.app_build = app_build
+        
+        # Cleared when the server cannot run driver scripts, batches then run step by step
+        self._driver_scripts = True
+    
+    @property
+    def parser(self) -> QueryParser:
+        if self._parser is None:
+            if FluentTestSuite._shared_parser is None:
+                FluentTestSuite._shared_parser = QueryParser()
+            self._parser = FluentTestSuite._shared_parser
+        return self._parser
+    
+    @parser.setter
+    def parser(self, parser: QueryParser):
+        self._parser = parser
+    
+    @functools.cached_property
+    def capabilities(self) -> Dict[str, Any]:
+        """Test configuration, built when a session is first set up"""
+        return {
             'platformName': 'Android',
-            'deviceName': device_name,
-            'appPackage': app_package,
-            'appActivity': app_activity,
+            'deviceName': self.device_name,
+            'appPackage': self.app_package,
+            'appActivity': self.app_activity,
             'automationName': 'UiAutomator2',
             'noReset': True,
             'fullReset': False,
             'newCommandTimeout': 300,
-            'autoGrantPermissions': True
+            'autoGrantPermissions': True,
+            'disableWindowAnimation': True
+        }
+    
+    @functools.cached_property
+    def _options(self) -> UiAutomator2Options:
+        """Session options, loaded from the capabilities once and reused by every setup()"""
+        return UiAutomator2Options().load_capabilities(self.capabilities)
+    
+    # Built-in flows are routed once, on first use; a run only fills in its values
+    @functools.cached_property
+    def _login_plan(self) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
+        return [self._compile_step(step) for step in _LOGIN_STEPS]
+    
+    @functools.cached_property
+    def _search_plan(self) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
+        return [self._compile_step(step) for step in _SEARCH_STEPS]
+    
+    @property
+    def fluent(self) -> Optional[FluentDriver]:
+        return self._fluent
+    
+    @fluent.setter
+    def fluent(self, fluent: Optional[FluentDriver]):
+        self._fluent = fluent
+        # Handlers are bound once per driver, so dispatching a query is a single dict lookup
+        self._action_dispatch = {} if fluent is None else {
+            'click': fluent.click,
+            'wait': lambda query: fluent.wait_for(query) is not None,
+            'verify': fluent.is_present
         }
     
     def setup(self):
         """Initialize Appium driver and FluentTest"""
         try:
-            options = UiAutomator2Options().load_capabilities(self.capabilities)
-            self.driver = webdriver.Remote('http://localhost:4723', options=options)
+            # Talk to the Appium server reported in directConnect* capabilities once the session
+            # exists, skipping any proxy or grid hop; without those capabilities this changes nothing
+            self.driver = webdriver.Remote('http://localhost:4723', options=self._options, direct_connection=True)
+            try:
+                self.driver.update_settings(_DRIVER_SETTINGS)
+            except WebDriverException as e:
+                logger.warning(f"Could not apply driver settings: {e}")
             self.fluent = FluentDriver(self.driver)
             
             logger.info("FluentTest setup completed")
@@ -61,6 +284,13 @@ class FluentTestSuite:
     
     def teardown(self):
         """Clean up resources"""
+        if self._report_future is not None:
+            # Make sure the last report is on disk before the suite goes away
+            try:
+                self._report_future.result()
+            except Exception as e:
+                logger.warning(f"Error writing report: {e}")
+        
         if self.driver:
             try:
                 self.driver.quit()
@@ -71,52 +301,197 @@ class FluentTestSuite:
     @contextmanager
     def test_context(self, test_name: str):
         """Context manager for individual tests"""
-        start_time = time.time()
-        test_result = {
-            'test_name': test_name,
-            'start_time': datetime.now().isoformat(),
-            'success': False,
-            'error': None,
-            'duration': 0,
-            'queries_used': []
-        }
+        # Wall clock is kept for the timestamp only; durations come from the monotonic counter
+        start_ns = time.perf_counter_ns()
+        test_result = TestResult(test_name=test_name, start_wall=time.time())
         
         try:
             logger.info(f"Starting test: {test_name}")
             yield test_result
-            test_result['success'] = True
+            test_result.success = True
             logger.info(f"Test passed: {test_name}")
             
         except Exception as e:
-            test_result['error'] = str(e)
-            test_result['success'] = False
+            test_result.error = str(e)
+            test_result.success = False
             logger.error(f"Test failed: {test_name} - {e}")
         
         finally:
-            test_result['duration'] = time.time() - start_time
+            test_result.duration = (time.perf_counter_ns() - start_ns) / 1e9
             self.test_results.append(test_result)
     
+    def _result_cache_path(self, test_name: str, queries: List[str]) -> str:
+        """Cache file for one test definition against the configured app build"""
+        key = hashlib.blake2b('\n'.join([self.app_package, self.app_build, test_name] + queries).encode('utf-8'),
+                              digest_size=16).hexdigest()
+        return os.path.join(self.result_cache_dir, key + '.json')
+    
+    def _run_flow(self, test_name: str, plan: List[Tuple[str, str, Optional[str], Optional[str]]], **values: str):
+        """Run a precompiled flow as one test, replaying a cached pass when result caching is on"""
+        cache_path = None
+        if self.result_cache_dir is not None:
+            queries = [template.format(**values) for template, _, _, _ in plan]
+            cache_path = self._result_cache_path(test_name, queries)
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = None
+            # A truncated or hand-edited file is a miss, the test simply runs again
+            if isinstance(cached, dict) and isinstance(cached.get('duration'), (int, float)):
+                logger.info(f"Test passed (cached): {test_name}")
+                self.test_results.append(TestResult(
+                    test_name=test_name, start_wall=time.time(), success=True,
+                    duration=cached['duration'], queries_used=queries, cached=True
+                ))
+                return
+        
+        with self.test_context(test_name) as test_result:
+            self._run_plan(plan, test_result, **values)
+        
+        if cache_path is not None and test_result.success:
+            self._store_result(cache_path, test_result)
+    
+    def _store_result(self, cache_path: str, test_result: TestResult):
+        """Save a passed run for replay; the queries stay out of the file since they hold typed values"""
+        try:
+            os.makedirs(self.result_cache_dir, exist_ok=True)
+            # Written aside and renamed into place, so a reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.result_cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'duration': test_result.duration}, f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not cache result for {test_result.test_name}: {e}")
+    
+    def _build_route(self, query: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Reduce a query to the (action, text, field query) that execute_query dispatches on"""
+        parsed = self.parser.parse(query)
+        if parsed.action == 'type' and parsed.target_element['text_content']:
+            return parsed.action, parsed.target_element['text_content'][0], _field_query(query)
+        return parsed.action, None, None
+    
+    def _compile_step(self, template: str) -> Tuple[str, str, Optional[str], Optional[str]]:
+        """Route a step template ahead of time, keeping its {placeholders} for the run values"""
+        return (template,) + self._route(template)
+    
+    def _run_plan(self, plan: List[Tuple[str, str, Optional[str], Optional[str]]], test_result: TestResult,
+                  **values: str):
+        """Run precompiled steps, substituting this run's values without parsing the queries again"""
+        steps = []
+        for template, action, text, field_query in plan:
+            query = template.format(**values)
+            test_result.queries_used.append(query)
+            if text is not None:
+                text = text.format(**values)
+            steps.append((query, action, text, field_query))
+        
+        failed = self._execute_steps(steps, settle=True)
+        assert failed is None, f"Failed: {failed}"
+    
+    def execute_batch(self, queries: List[str]) -> bool:
+        """Execute queries in order, sending steps on the same screen to the server in one round-trip"""
+        try:
+            steps = [(query,) + self._route(query) for query in queries]
+        except Exception as e:
+            logger.error(f"Error executing batch: {e}")
+            return False
+        return self._execute_steps(steps) is None
+    
+    def _execute_steps(self, steps: List[Tuple[str, str, Optional[str], Optional[str]]],
+                       settle: bool = False) -> Optional[str]:
+        """Run routed steps, returning the first failing query or None"""
+        for batch in self._group_steps(steps):
+            failed = self._run_batch(batch)
+            if failed is not None:
+                return failed
+            # Typing, waiting and verifying leave the screen as it is; anything else
+            # ends in a click, so let the UI settle before the next lookup
+            if settle and batch[-1][1] not in ('type', 'wait', 'verify'):
+                self.fluent.wait_until_idle(timeout=1.0)
+        return None
+    
+    @staticmethod
+    def _group_steps(steps: List[Tuple[str, str, Optional[str], Optional[str]]]):
+        """Split steps into batches that can be resolved on a single screen snapshot"""
+        # Typing leaves the screen as it is, so consecutive types and the click that
+        # follows them go together; anything else runs on its own
+        groups, batch = [], []
+        for step in steps:
+            _, action, text, _ = step
+            if action == 'click' or (action == 'type' and text is not None):
+                batch.append(step)
+                if action == 'click':
+                    groups.append(batch)
+                    batch = []
+            else:
+                if batch:
+                    groups.append(batch)
+                    batch = []
+                groups.append([step])
+        if batch:
+            groups.append(batch)
+        return groups
+    
+    def _run_batch(self, batch: List[Tuple[str, str, Optional[str], Optional[str]]]) -> Optional[str]:
+        """Run click/type steps as one driver script, falling back to one command per step"""
+        if len(batch) > 1 and self._driver_scripts:
+            with self.fluent.frozen_source():
+                elements = [self.fluent.find(query if action == 'click' else field_query)
+                            for query, action, _, field_query in batch]
+            
+            if all(element is not None for element in elements):
+                script = _BATCH_SCRIPT % json.dumps([
+                    (element.id, text if action == 'type' else None)
+                    for element, (_, action, text, _) in zip(elements, batch)
+                ])
+                for query, _, _, _ in batch:
+                    logger.info(f"Executing: {query}")
+                try:
+                    failed_index = self.driver.execute_driver(script).result
+                except WebDriverException as e:
+                    # Needs the execute-driver plugin on the Appium server
+                    logger.info(f"Driver scripts unavailable, running steps individually: {e}")
+                    self._driver_scripts = False
+                else:
+                    self.fluent.invalidate_cache()
+                    if failed_index is not None and failed_index >= 0:
+                        logger.error(f"Error executing query '{batch[failed_index][0]}' in batch")
+                        return batch[failed_index][0]
+                    return None
+        
+        for step in batch:
+            if not self._dispatch(*step):
+                return step[0]
+        return None
+    
     def execute_query(self, query: str) -> bool:
         """Execute natural language query"""
         try:
-            parsed = self.parser.parse(query)
+            route = self._route(query)
+        except Exception as e:
+            logger.error(f"Error executing query '{query}': {e}")
+            return False
+        return self._dispatch(query, *route)
+    
+    def _dispatch(self, query: str, action: str, text: Optional[str], field_query: Optional[str]) -> bool:
+        """Execute an already routed query"""
+        try:
             logger.info(f"Executing: {query}")
             
-            if parsed.action == 'click':
-                return self.fluent.click(query)
-            elif parsed.action == 'type':
-                if parsed.target_element['text_content']:
-                    text = parsed.target_element['text_content'][0]
-                    field_query = query.split('in')[-1].strip() if 'in' in query else 'input field'
-                    return self.fluent.type_text(text, field_query)
-            elif parsed.action == 'wait':
-                element = self.fluent.wait_for(query)
-                return element is not None
-            elif parsed.action == 'verify':
-                return self.fluent.is_present(query)
+            handler = self._action_dispatch.get(action)
+            if handler is not None:
+                return handler(query)
+            elif action == 'type':
+                if text is not None:
+                    return self._fluent.type_text(text, field_query)
             else:
                 # Default to click
-                return self.fluent.click(query)
+                return self._fluent.click(query)
                 
         except Exception as e:
             logger.error(f"Error executing query '{query}': {e}")
@@ -124,91 +499,91 @@ class FluentTestSuite:
     
     def run_login_test(self, username: str, password: str):
         """Example login test"""
-        with self.test_context("Login Test") as test_result:
-            queries = [
-                f'type "{username}" in username field',
-                f'type "{password}" in password field',
-                'click login button'
-            ]
-            
-            for query in queries:
-                test_result['queries_used'].append(query)
-                assert self.execute_query(query), f"Failed: {query}"
-                time.sleep(1)
+        self._run_flow("Login Test", self._login_plan, username=username, password=password)
     
     def run_search_test(self, search_term: str):
         """Example search test"""
-        with self.test_context("Search Test") as test_result:
-            queries = [
-                'click search button',
-                f'type "{search_term}" in search field',
-                'click search or press enter'
-            ]
+        self._run_flow("Search Test", self._search_plan, search_term=search_term)
+    
+    def run_parallel(self, tests: List[Callable[['FluentTestSuite'], None]],
+                     device_names: Optional[List[str]] = None):
+        """Run tests across devices, one session per device; each test is called with the suite to run on"""
+        device_names = device_names or [self.device_name]
+        pending = queue.Queue()
+        for test in tests:
+            pending.put(test)
+        results_lock = threading.Lock()
+        
+        def run_on_device(index: int, device_name: str):
+            suite = FluentTestSuite(self.app_package, self.app_activity, device_name=device_name,
+                                    result_cache_dir=self.result_cache_dir, app_build=self.app_build)
+            # Concurrent UiAutomator2 sessions need their own device and server port
+            suite.capabilities['udid'] = device_name
+            suite.capabilities['systemPort'] = 8200 + index
+            if not suite.setup():
+                logger.error(f"Skipping device {device_name}: setup failed")
+                return
             
-            for query in queries:
-                test_result['queries_used'].append(query)
-                assert self.execute_query(query), f"Failed: {query}"
-                time.sleep(1)
+            try:
+                while True:
+                    try:
+                        test = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    test(suite)
+                    with results_lock:
+                        self.test_results.extend(suite.test_results)
+                    suite.test_results.clear()
+            finally:
+                suite.teardown()
+        
+        if len(device_names) == 1:
+            run_on_device(0, device_names[0])
+            return
+        
+        # Devices pull tests from the shared queue, so a slow device simply runs fewer of them
+        with ThreadPoolExecutor(max_workers=len(device_names)) as executor:
+            for future in [executor.submit(run_on_device, index, device_name)
+                           for index, device_name in enumerate(device_names)]:
+                future.result()
     
-    def generate_report(self, filename: str = "test_report.html"):
-        """Generate HTML test report"""
+    def generate_report(self, filename: str = "test_report.html", format: str = "html") -> Future:
+        """Generate an HTML (or 'json') test report, writing it in the background; returns the write's future"""
+        if format == 'json':
+            # Structured results for CI, without rendering any HTML
+            if HAS_ORJSON:
+                content = orjson.dumps(list(self.test_results), option=orjson.OPT_INDENT_2)
+            else:
+                content = json.dumps([asdict(result) for result in self.test_results], indent=2).encode('utf-8')
+            self._report_future = _REPORT_EXECUTOR.submit(_write_report, filename, content)
+            return self._report_future
+        elif format != 'html':
+            raise ValueError(f"Unsupported report format: {format}")
+        
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result['success'])
+        passed_tests = sum(1 for result in self.test_results if result.success)
         
-        html_content = """<!DOCTYPE html>
-<html>
-<head>
-    <title>FluentTest Report</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .header { background: #f0f8ff; padding: 20px; border-radius: 5px; }
-        .summary { display: flex; gap: 20px; margin: 20px 0; }
-        .stat { background: #e8f4f8; padding: 15px; border-radius: 5px; text-align: center; }
-        .test { margin: 10px 0; padding: 15px; border-radius: 5px; }
-        .passed { background: #d4edda; }
-        .failed { background: #f8d7da; }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>FluentTest Report</h1>
-        <p>Generated: """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """</p>
-        <p>App: """ + self.app_package + """</p>
-    </div>
-    
-    <div class="summary">
-        <div class="stat">
-            <h3>Total Tests</h3>
-            <h2>""" + str(total_tests) + """</h2>
-        </div>
-        <div class="stat">
-            <h3>Passed</h3>
-            <h2 style="color: green;">""" + str(passed_tests) + """</h2>
-        </div>
-        <div class="stat">
-            <h3>Success Rate</h3>
-            <h2>""" + (f"{(passed_tests/total_tests*100):.1f}" if total_tests > 0 else "0") + """%</h2>
-        </div>
-    </div>
-    
-    <h2>Test Results</h2>"""
+        parts = [_REPORT_HEADER_TEMPLATE.format_map({
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'app_package': self.app_package,
+            'total_tests': total_tests,
+            'passed_tests': passed_tests,
+            'success_rate': f"{(passed_tests/total_tests*100):.1f}" if total_tests > 0 else "0"
+        })]
         
+        # Collect blocks and join once instead of growing one string per test
+        render_test = _REPORT_TEST_TEMPLATE.format_map
         for result in self.test_results:
-            status = "passed" if result['success'] else "failed"
-            status_text = "PASSED" if result['success'] else "FAILED"
-            
-            html_content += f"""
-            <div class="test {status}">
-                <h3>{result['test_name']} - {status_text}</h3>
-                <p>Duration: {result['duration']:.2f}s</p>
-                <p>Queries: {', '.join(result['queries_used'])}</p>
-                {f"<p>Error: {result['error']}</p>" if result['error'] else ""}
-            </div>
-            """
-        
-        html_content += "</body></html>"
+            parts.append(render_test({
+                'status': "passed" if result.success else "failed",
+                'status_text': ("PASSED (cached)" if result.cached else "PASSED") if result.success else "FAILED",
+                'test_name': result.test_name,
+                'duration': result.duration,
+                'queries': ', '.join(result.queries_used),
+                'error': f"<p>Error: {result.error}</p>" if result.error else ""
+            }))
         
-        with open(filename, 'w') as f:
-            f.write(html_content)
+        parts.append("</body></html>")
         
-        logger.info(f"Report generated: {filename}")
+        self._report_future = _REPORT_EXECUTOR.submit(_write_report, filename, ''.join(parts).encode('utf-8'))
+        return self._report_future
@@ -123,6 +123,16 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for pulling text content out of queries
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"]*)"')
+_SINGLE_QUOTED_RE = re.compile(r"'([^']*)'")
+_CONTENT_PATTERNS = [
+    re.compile(r'with\\s+text\\s+["\\']*([^"\\']+)["\\']*', re.IGNORECASE),
+    re.compile(r'containing\\s+["\\']*([^"\\']+)["\\']*', re.IGNORECASE),
+    re.compile(r'labeled\\s+["\\']*([^"\\']+)["\\']*', re.IGNORECASE),
+    re.compile(r'says\\s+["\\']*([^"\\']+)["\\']*', re.IGNORECASE)
+]
+
 
 class LocatorType(Enum):
     """Supported locator types for element identification"""
@@ -218,24 +228,16 @@ class NaturalLanguageProcessor:
     def extract_text_content(self, query: str) -> List[str]:
         """Extract quoted text or specific content from query"""
         # Find text in quotes
-        quoted_text = re.findall(r'"([^"]*)"', query)
-        quoted_text.extend(re.findall(r"'([^']*)'", query))
+        quoted_text = _DOUBLE_QUOTED_RE.findall(query)
+        quoted_text.extend(_SINGLE_QUOTED_RE.findall(query))
         
         if quoted_text:
             return quoted_text
         
         # Extract potential text content
-        content_patterns = [
-            r'with\\s+text\\s+["\\']*([^"\\']+)["\\']*',
-            r'containing\\s+["\\']*([^"\\']+)["\\']*',
-            r'labeled\\s+["\\']*([^"\\']+)["\\']*',
-            r'says\\s+["\\']*([^"\\']+)["\\']*'
-        ]
-        
         extracted_text = []
-        for pattern in content_patterns:
-            matches = re.findall(pattern, query, re.IGNORECASE)
-            extracted_text.extend(matches)
+        for pattern in _CONTENT_PATTERNS:
+            extracted_text.extend(pattern.findall(query))
         
         return extracted_text
 
@@ -373,6 +375,14 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared by every QueryParser
+_CONDITIONAL_RE = re.compile(r'\\bif\\b|\\bwhen\\b|\\bunless\\b')
+_SEQUENCE_RE = re.compile(r'\\bthen\\b|\\bafter\\b|\\bnext\\b')
+_DESCRIPTIVE_RE = re.compile(r'\\bcontaining\\b|\\bwith\\b|\\bthat\\b')
+_QUOTED_RE = re.compile(r'"([^"]*)"')
+_WAIT_TIME_RE = re.compile(r'wait\\s+(\\d+)\\s*(?:second|sec)')
+_IF_THEN_RE = re.compile(r'if\\s+(.+?)\\s+then')
+
 
 class QueryType(Enum):
     """Types of natural language queries"""
@@ -400,17 +410,17 @@ class QueryParser:
     
     def __init__(self):
         self.action_patterns = {
-            'click': r'(?:click|tap|press|select)\\s+(.+)',
-            'type': r'(?:type|enter|input)\\s+"([^"]+)"\\s+(?:in|into)\\s+(.+)',
-            'scroll': r'(?:scroll|swipe)\\s+(up|down|left|right)',
-            'wait': r'wait\\s+(?:for\\s+)?(.+)',
-            'verify': r'(?:verify|check|assert)\\s+(?:that\\s+)?(.+)'
+            'click': re.compile(r'(?:click|tap|press|select)\\s+(.+)'),
+            'type': re.compile(r'(?:type|enter|input)\\s+"([^"]+)"\\s+(?:in|into)\\s+(.+)'),
+            'scroll': re.compile(r'(?:scroll|swipe)\\s+(up|down|left|right)'),
+            'wait': re.compile(r'wait\\s+(?:for\\s+)?(.+)'),
+            'verify': re.compile(r'(?:verify|check|assert)\\s+(?:that\\s+)?(.+)')
         }
         
         self.element_patterns = {
-            'button': r'(?:button|btn)(?:\\s+(?:with|containing|labeled)\\s+"([^"]+)")?',
-            'input': r'(?:input|field|textbox)(?:\\s+(?:with|containing|labeled)\\s+"([^"]+)")?',
-            'text': r'(?:text|label)(?:\\s+(?:with|containing|saying)\\s+"([^"]+)")?'
+            'button': re.compile(r'(?:button|btn)(?:\\s+(?:with|containing|labeled)\\s+"([^"]+)")?'),
+            'input': re.compile(r'(?:input|field|textbox)(?:\\s+(?:with|containing|labeled)\\s+"([^"]+)")?'),
+            'text': re.compile(r'(?:text|label)(?:\\s+(?:with|containing|saying)\\s+"([^"]+)")?')
         }
     
     def parse(self, query: str) -> ParsedQuery:
@@ -447,11 +457,11 @@ class QueryParser:
     
     def _classify_query(self, query: str) -> QueryType:
         """Classify the type of query"""
-        if re.search(r'\\bif\\b|\\bwhen\\b|\\bunless\\b', query):
+        if _CONDITIONAL_RE.search(query):
             return QueryType.CONDITIONAL
-        elif re.search(r'\\bthen\\b|\\bafter\\b|\\bnext\\b', query):
+        elif _SEQUENCE_RE.search(query):
             return QueryType.SEQUENCE
-        elif re.search(r'\\bcontaining\\b|\\bwith\\b|\\bthat\\b', query):
+        elif _DESCRIPTIVE_RE.search(query):
             return QueryType.DESCRIPTIVE
         else:
             return QueryType.SIMPLE_ACTION
@@ -459,7 +469,7 @@ class QueryParser:
     def _extract_action(self, query: str) -> str:
         """Extract the main action from query"""
         for action, pattern in self.action_patterns.items():
-            if re.search(pattern, query):
+            if pattern.search(query):
                 return action
         
         # Default action detection
@@ -481,13 +491,13 @@ class QueryParser:
         }
         
         # Extract quoted text
-        quoted_text = re.findall(r'"([^"]*)"', query)
+        quoted_text = _QUOTED_RE.findall(query)
         if quoted_text:
             target['text_content'] = quoted_text
         
         # Extract element type
         for element_type, pattern in self.element_patterns.items():
-            if re.search(pattern, query):
+            if pattern.search(query):
                 target['element_type'] = element_type
                 break
         
@@ -504,7 +514,7 @@ class QueryParser:
             modifiers['speed'] = 'fast'
         
         # Extract wait times
-        wait_match = re.search(r'wait\\s+(\\d+)\\s*(?:second|sec)', query)
+        wait_match = _WAIT_TIME_RE.search(query)
         if wait_match:
             modifiers['wait_time'] = int(wait_match.group(1))
         
@@ -515,7 +525,7 @@ class QueryParser:
         conditions = []
         
         # Look for conditional patterns
-        if_match = re.search(r'if\\s+(.+?)\\s+then', query)
+        if_match = _IF_THEN_RE.search(query)
         if if_match:
             conditions.append({
                 'type': 'if',
@@ -550,10 +560,12 @@ class QueryParser:
 # Comprehensive test framework for natural language UI automation.
 
 import unittest
+import sys
 import time
 import logging
 from typing import Dict, Any, List, Optional
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 import json
 from datetime import datetime
 
@@ -566,6 +578,27 @@ from .runtime_parser import QueryParser
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class TestResult:
+    """Outcome of a single test run through FluentTestSuite.test_context"""
+    __test__ = False  # not a pytest test class despite the name
+    
+    test_name: str
+    start_wall: float
+    success: bool = False
+    error: Optional[str] = None
+    duration: float = 0.0
+    queries_used: List[str] = field(default_factory=list)
+    
+    @property
+    def start_time(self) -> str:
+        """ISO timestamp of the start, formatted only when someone asks for it"""
+        return datetime.fromtimestamp(self.start_wall).isoformat()
+
 
 class FluentTestSuite:
     """Complete test suite using natural language UI automation"""
@@ -618,29 +651,23 @@ class FluentTestSuite:
     @contextmanager
     def test_context(self, test_name: str):
         """Context manager for individual tests"""
-        start_time = time.time()
-        test_result = {
-            'test_name': test_name,
-            'start_time': datetime.now().isoformat(),
-            'success': False,
-            'error': None,
-            'duration': 0,
-            'queries_used': []
-        }
+        # Epoch start for the record; the duration comes from the monotonic clock
+        start = time.monotonic()
+        test_result = TestResult(test_name=test_name, start_wall=time.time())
         
         try:
             logger.info(f"Starting test: {test_name}")
             yield test_result
-            test_result['success'] = True
+            test_result.success = True
             logger.info(f"Test passed: {test_name}")
             
         except Exception as e:
-            test_result['error'] = str(e)
-            test_result['success'] = False
+            test_result.error = str(e)
+            test_result.success = False
             logger.error(f"Test failed: {test_name} - {e}")
         
         finally:
-            test_result['duration'] = time.time() - start_time
+            test_result.duration = time.monotonic() - start
             self.test_results.append(test_result)
     
     def execute_query(self, query: str) -> bool:
@@ -679,7 +706,7 @@ class FluentTestSuite:
             ]
             
             for query in queries:
-                test_result['queries_used'].append(query)
+                test_result.queries_used.append(query)
                 assert self.execute_query(query), f"Failed: {query}"
                 time.sleep(1)
     
@@ -693,14 +720,14 @@ class FluentTestSuite:
             ]
             
             for query in queries:
-                test_result['queries_used'].append(query)
+                test_result.queries_used.append(query)
                 assert self.execute_query(query), f"Failed: {query}"
                 time.sleep(1)
     
     def generate_report(self, filename: str = "test_report.html"):
         """Generate HTML test report"""
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result['success'])
+        passed_tests = sum(1 for result in self.test_results if result.success)
         
         html_content = """<!DOCTYPE html>
 <html>
@@ -741,22 +768,23 @@ class FluentTestSuite:
     <h2>Test Results</h2>"""
         
         for result in self.test_results:
-            status = "passed" if result['success'] else "failed"
-            status_text = "PASSED" if result['success'] else "FAILED"
+            status = "passed" if result.success else "failed"
+            status_text = "PASSED" if result.success else "FAILED"
             
             html_content += f"""
             <div class="test {status}">
-                <h3>{result['test_name']} - {status_text}</h3>
-                <p>Duration: {result['duration']:.2f}s</p>
-                <p>Queries: {', '.join(result['queries_used'])}</p>
-                {f"<p>Error: {result['error']}</p>" if result['error'] else ""}
+                <h3>{result.test_name} - {status_text}</h3>
+                <p>Duration: {result.duration:.2f}s</p>
+                <p>Queries: {', '.join(result.queries_used)}</p>
+                {f"<p>Error: {result.error}</p>" if result.error else ""}
             </div>
             """
         
         html_content += "</body></html>"
         
-        with open(filename, 'w') as f:
-            f.write(html_content)
+        # Encode once and hand the bytes to a binary file, skipping the text-mode codec layer
+        with open(filename, 'wb') as f:
+            f.write(html_content.encode('utf-8'))
         
         logger.info(f"Report generated: {filename}")
 '''
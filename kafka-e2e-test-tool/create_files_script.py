@@ -5,33 +5,14 @@ Run this script to set up the complete project structure
 """
 
 import os
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-def create_file(filepath, content):
-    """Create a file with the given content"""
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, 'w') as f:
-        f.write(content)
-    print(f"✅ Created: {filepath}")
+# Contents of the generated files
 
-def main():
-    print("🚀 Setting up Kafka E2E Test Tool project structure...")
-    
-    # Create __init__.py files
-    init_files = [
-        "src/__init__.py",
-        "src/config/__init__.py", 
-        "src/kafka/__init__.py",
-        "src/validators/__init__.py",
-        "src/reports/__init__.py",
-        "src/utils/__init__.py"
-    ]
-    
-    for init_file in init_files:
-        create_file(init_file, "# Package initialization\n")
-    
-    # Create logger module
-    logger_content = '''import logging
+# Same payload for every package, encoded once
+INIT_CONTENT = b"# Package initialization\n"
+
+LOGGER_CONTENT = r'''import logging
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -47,24 +28,96 @@ def setup_logger(name: str, log_file=None, verbose: bool = False):
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
+    # Pass values as arguments (logger.info('%s', value)) so records below the level are never formatted
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
     return logger
 '''
-    create_file("src/utils/logger.py", logger_content)
-    
-    # Create config parser module
-    config_parser_content = '''import json
+
+CONFIG_PARSER_CONTENT = r'''import copy
+import importlib.util
+import json
+import os
+import stat
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List
 
+# PyYAML is only imported once a YAML file actually needs parsing
+HAS_YAML = importlib.util.find_spec('yaml') is not None
+
 try:
-    import yaml
-    HAS_YAML = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_YAML = False
+    HAS_ORJSON = False
+
+def _parse_yaml(path: Path) -> Any:
+    """Parse a YAML file"""
+    import yaml
+    # LibYAML's C loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=loader)
+
+def _parse_json(path: Path) -> Any:
+    """Parse a JSON file"""
+    if HAS_ORJSON:
+        data = path.read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The json module also takes NaN/Infinity and integers past 64 bits
+            return json.loads(data)
+    
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _write_json_sidecar(sidecar: Path, source: Path, source_key: Dict[str, int], data: Any):
+    """Save parsed YAML as JSON so later runs can skip the YAML parser"""
+    try:
+        content = json.dumps({'source': source_key, 'config': data})
+        # Only keep sidecars that load back to the same data (no dates, non-string keys, ...)
+        if json.loads(content)['config'] != data:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+            # mkstemp creates the file 0600; readable by whoever can read the YAML instead
+            os.chmod(tmp_path, stat.S_IMODE(source.stat().st_mode))
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except (TypeError, ValueError, OSError):
+        pass
+
+@lru_cache(maxsize=128)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime, size); an edited file gets a new key"""
+    config_file = Path(path)
+    if config_file.suffix.lower() in ['.yaml', '.yml']:
+        # config.yaml.json holds the last parse together with the mtime and size of the YAML it came
+        # from; only an exact match is trusted, since restored or quickly re-edited files defeat ordering
+        sidecar = config_file.with_name(config_file.name + '.json')
+        source_key = {'mtime_ns': mtime_ns, 'size': size}
+        try:
+            cached = _parse_json(sidecar)
+            if isinstance(cached, dict) and cached.get('source') == source_key and 'config' in cached:
+                return cached['config']
+        except (OSError, ValueError):
+            pass
+        
+        if HAS_YAML:
+            data = _parse_yaml(config_file)
+            _write_json_sidecar(sidecar, config_file, source_key, data)
+            return data
+    
+    return _parse_json(config_file)
 
 class ConfigParser:
     """Simple configuration parser"""
@@ -76,11 +129,9 @@ class ConfigParser:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_file, 'r') as f:
-            if config_file.suffix.lower() in ['.yaml', '.yml'] and HAS_YAML:
-                return yaml.safe_load(f)
-            else:
-                return json.load(f)
+        st = config_file.stat()
+        # Callers get their own copy, so changes to it never leak into the cache
+        return copy.deepcopy(_load_cached(str(config_file.resolve()), st.st_mtime_ns, st.st_size))
     
     def create_default_config(self, producer_topic: str, consumer_topic: str, 
                             bootstrap_servers: str, messages: List[str], 
@@ -152,11 +203,20 @@ class ConfigParser:
                 "allow_duplicates": False
             }
         }
-'''
-    create_file("src/config/config_parser.py", config_parser_content)
     
-    # Create kafka manager module
-    kafka_manager_content = '''import time
+    def generate_sample_config_json(self, producer_topic: str, consumer_topic: str) -> str:
+        """Generate sample configuration as indented JSON text"""
+        head, middle, tail = _SAMPLE_CONFIG_PARTS
+        return head + json.dumps(producer_topic) + middle + json.dumps(consumer_topic) + tail
+
+# Sample config serialized once at import, split around the producer and consumer topics
+_TOPIC_PLACEHOLDER = '\0topic'
+_SAMPLE_CONFIG_PARTS = tuple(json.dumps(
+    ConfigParser().generate_sample_config(_TOPIC_PLACEHOLDER, _TOPIC_PLACEHOLDER), indent=2
+).split(json.dumps(_TOPIC_PLACEHOLDER)))
+'''
+
+KAFKA_MANAGER_CONTENT = r'''import time
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -165,8 +225,10 @@ from dataclasses import dataclass
 @dataclass
 class KafkaMessage:
     """Represents a Kafka message"""
+    __slots__ = ('key', 'value', 'topic', 'partition', 'offset', 'timestamp', 'headers')
+    
     key: Optional[str]
-    value: str
+    value: bytes  # UTF-8, as it travels on the wire
     topic: str
     partition: int
     offset: int
@@ -179,17 +241,22 @@ class MockKafkaManager:
     def __init__(self):
         self.messages = {}
         self.consumers = {}
+        # Next offset per topic, kept apart from the buffer so offsets don't depend on what it still holds
+        self.offsets = {}
     
     def produce_message(self, topic: str, message: str, key: Optional[str] = None) -> bool:
         if topic not in self.messages:
             self.messages[topic] = []
         
+        offset = self.offsets.get(topic, 0)
+        self.offsets[topic] = offset + 1
+        
         kafka_msg = KafkaMessage(
             key=key,
-            value=message,
+            value=message.encode('utf-8'),
             topic=topic,
             partition=0,
-            offset=len(self.messages[topic]),
+            offset=offset,
             timestamp=datetime.now(),
             headers={}
         )
@@ -197,26 +264,58 @@ class MockKafkaManager:
         self.messages[topic].append(kafka_msg)
         return True
     
+    def produce_messages(self, topic: str, messages: List[str]) -> int:
+        """Append a whole batch at once with one shared timestamp"""
+        buf = self.messages.setdefault(topic, [])
+        base = self.offsets.get(topic, 0)
+        self.offsets[topic] = base + len(messages)
+        timestamp = datetime.now()
+        buf.extend(KafkaMessage(key=None, value=message.encode('utf-8'), topic=topic, partition=0,
+                                offset=base + i, timestamp=timestamp, headers={})
+                   for i, message in enumerate(messages))
+        return len(messages)
+    
     def consume_messages(self, topic: str, timeout: int = 30):
         if topic not in self.consumers:
             self.consumers[topic] = 0
         
         if topic in self.messages:
-            available_messages = self.messages[topic][self.consumers[topic]:]
-            for msg in available_messages:
-                self.consumers[topic] += 1
-                yield msg
+            # Walk forward from the cursor instead of copying the unread tail on every poll
+            buf = self.messages[topic]
+            for index in range(self.consumers[topic], len(buf)):
+                self.consumers[topic] = index + 1
+                yield buf[index]
     
     def reset_topic(self, topic: str):
         if topic in self.messages:
             self.messages[topic] = []
         if topic in self.consumers:
             self.consumers[topic] = 0
+        self.offsets.pop(topic, None)
+
+# kafka-python producer settings applied unless producer_config overrides them:
+# linger briefly so batched sends fill larger requests
+_PRODUCER_DEFAULTS = {'linger_ms': 10, 'batch_size': 65536}
+
+def _producer_settings(producer_config: Optional[Dict[str, Any]], known: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a config's producer settings into KafkaProducer keyword arguments"""
+    settings = dict(_PRODUCER_DEFAULTS)
+    for key, value in (producer_config or {}).items():
+        # Java client spelling (linger.ms) maps onto kafka-python's (linger_ms)
+        name = key.replace('.', '_')
+        if name == 'bootstrap_servers':
+            continue  # Taken from kafka.bootstrap_servers
+        if name not in known:
+            print(f"Warning: ignoring unsupported producer setting '{key}'")
+            continue
+        settings[name] = value
+    return settings
 
 class KafkaManager:
     """Kafka manager with mock support"""
     
-    def __init__(self, bootstrap_servers: str, use_mock: bool = False):
+    def __init__(self, bootstrap_servers: str, use_mock: bool = False,
+                 producer_config: Optional[Dict[str, Any]] = None):
         self.bootstrap_servers = bootstrap_servers
         self.use_mock = use_mock
         
@@ -227,10 +326,8 @@ class KafkaManager:
             try:
                 # Try to import kafka-python
                 from kafka import KafkaProducer, KafkaConsumer
-                self.producer = KafkaProducer(
-                    bootstrap_servers=bootstrap_servers,
-                    value_serializer=lambda v: v.encode('utf-8')
-                )
+                self.producer = KafkaProducer(bootstrap_servers=bootstrap_servers,
+                                              **_producer_settings(producer_config, KafkaProducer.DEFAULT_CONFIG))
             except ImportError:
                 print("Warning: kafka-python not installed. Using mock mode.")
                 self.use_mock = True
@@ -241,7 +338,7 @@ class KafkaManager:
             return self.mock_manager.produce_message(topic, message, key)
         
         try:
-            future = self.producer.send(topic, value=message, key=key)
+            future = self.producer.send(topic, value=message.encode('utf-8'), key=key)
             future.get(timeout=10)
             return True
         except Exception as e:
@@ -249,21 +346,32 @@ class KafkaManager:
             return False
     
     def produce_messages_batch(self, topic: str, messages: List[str]) -> Dict[str, Any]:
-        start_time = time.time()
-        success_count = 0
+        start_ns = time.perf_counter_ns()
         
-        for message in messages:
-            if self.produce_message(topic, message):
-                success_count += 1
+        if self.use_mock:
+            success_count = self.mock_manager.produce_messages(topic, messages)
+        else:
+            # Queue every send first and wait once, instead of blocking on each message
+            futures = []
+            for message in messages:
+                try:
+                    futures.append(self.producer.send(topic, value=message.encode('utf-8')))
+                except Exception as e:
+                    print(f"Failed to produce message: {e}")
+            try:
+                self.producer.flush(timeout=10)
+            except Exception as e:
+                print(f"Failed to flush messages: {e}")
+            success_count = sum(1 for future in futures if future.succeeded())
         
-        end_time = time.time()
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         
         return {
             'total_messages': len(messages),
             'success_count': success_count,
             'failed_count': len(messages) - success_count,
-            'duration_seconds': end_time - start_time,
-            'messages_per_second': len(messages) / (end_time - start_time) if end_time > start_time else 0
+            'duration_seconds': duration,
+            'messages_per_second': len(messages) / duration if duration > 0 else 0
         }
     
     def consume_messages(self, topic: str, timeout: int = 30, max_messages: Optional[int] = None) -> List[KafkaMessage]:
@@ -282,11 +390,10 @@ class KafkaManager:
         if not self.use_mock and hasattr(self, 'producer'):
             self.producer.close()
 '''
-    create_file("src/kafka/kafka_manager.py", kafka_manager_content)
-    
-    # Create test validator module
-    test_validator_content = '''import time
-from datetime import datetime
+
+TEST_VALIDATOR_CONTENT = r'''import time
+from collections import Counter
+from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
 class TestValidator:
@@ -310,12 +417,14 @@ class TestValidator:
     
     def _run_single_test(self, test_case: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
         """Run a single test case"""
+        # One wall-clock read for the record; elapsed time comes from the monotonic counter
         start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             messages = test_case.get('messages', [])
             if not messages:
-                return self._create_error_result(test_case, start_time, "No test messages specified")
+                return self._create_error_result(test_case, start_time, start_ns, "No test messages specified")
             
             # Reset mock topics if using mock
             if self.kafka_manager.use_mock:
@@ -337,8 +446,12 @@ class TestValidator:
             consumed_messages = self.kafka_manager.consume_messages(consumer_topic, timeout=timeout)
             
             # Basic validation - check if all messages were delivered
-            consumed_values = [msg.value for msg in consumed_messages]
-            missing_messages = [msg for msg in messages if msg not in consumed_values]
+            # Multiset difference: linear, and a message produced twice must be consumed twice.
+            # Consumed values are UTF-8 bytes, so the produced side is encoded to match
+            consumed_values = Counter(msg.value for msg in consumed_messages)
+            produced_values = Counter(msg.encode('utf-8') for msg in messages)
+            missing_messages = [value.decode('utf-8')
+                                for value in (produced_values - consumed_values).elements()]
             
             validation_results = {
                 'delivery': {
@@ -349,8 +462,9 @@ class TestValidator:
                 }
             }
             
-            end_time = datetime.now()
-            duration_ms = (end_time - start_time).total_seconds() * 1000
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            end_time = start_time + timedelta(microseconds=elapsed_ns // 1000)
+            duration_ms = elapsed_ns / 1e6
             
             status = 'PASSED' if validation_results['delivery']['success'] else 'FAILED'
             
@@ -368,12 +482,13 @@ class TestValidator:
             }
             
         except Exception as e:
-            return self._create_error_result(test_case, start_time, str(e))
+            return self._create_error_result(test_case, start_time, start_ns, str(e))
     
-    def _create_error_result(self, test_case: Dict[str, Any], start_time: datetime, error: str):
+    def _create_error_result(self, test_case: Dict[str, Any], start_time: datetime, start_ns: int, error: str):
         """Create error result"""
-        end_time = datetime.now()
-        duration_ms = (end_time - start_time).total_seconds() * 1000
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        end_time = start_time + timedelta(microseconds=elapsed_ns // 1000)
+        duration_ms = elapsed_ns / 1e6
         
         return {
             'test_name': test_case['name'],
@@ -388,20 +503,124 @@ class TestValidator:
             'errors': [error]
         }
 '''
-    create_file("src/validators/test_validator.py", test_validator_content)
-    
-    # Create HTML reporter module
-    html_reporter_content = '''import json
+
+HTML_REPORTER_CONTENT = r'''import json
 from typing import List, Dict, Any
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj as UTF-8 JSON, with orjson when it can encode it"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+_REPORT_STYLE = """    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background: #f0f0f0; padding: 20px; border-radius: 5px; }
+        .summary { background: #e8f5e8; padding: 15px; margin: 20px 0; border-radius: 5px; }
+        .test-result { margin: 10px 0; padding: 10px; border: 1px solid #ddd; border-radius: 5px; }
+        .passed { background: #d4edda; }
+        .failed { background: #f8d7da; }
+        pre { background: #f8f9fa; padding: 10px; border-radius: 3px; }
+    </style>
+"""
+
+# Static document head and foot, encoded once and shared by both report layouts
+_REPORT_HEAD = ("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Kafka E2E Test Report</title>
+""" + _REPORT_STYLE + """</head>
+<body>
+""").encode('utf-8')
+_REPORT_FOOT = b"""</body>
+</html>
+"""
+
+# Static page that renders the report from one embedded JSON blob in the browser
+_BROWSER_REPORT_HEAD, _BROWSER_REPORT_TAIL = (_REPORT_HEAD + """    <div class="header">
+        <h1>🚀 Kafka E2E Test Report</h1>
+        <p><strong>Generated:</strong> <span id="generated"></span></p>
+        <p><strong>Bootstrap Servers:</strong> <span id="bootstrap-servers"></span></p>
+    </div>
+    
+    <div class="summary">
+        <h2>Summary</h2>
+        <p><strong>Total Tests:</strong> <span id="total"></span></p>
+        <p><strong>Passed:</strong> <span id="passed"></span></p>
+        <p><strong>Failed:</strong> <span id="failed"></span></p>
+        <p><strong>Pass Rate:</strong> <span id="pass-rate"></span></p>
+    </div>
+    
+    <h2>Test Results</h2>
+    <div id="results"></div>
+    
+    <h2>Configuration</h2>
+    <pre id="config"></pre>
+    
+    <script>window.__DATA__ = {DATA};</script>
+    <script>
+    (function () {
+        var data = window.__DATA__;
+        function setText(id, value) { document.getElementById(id).textContent = value; }
+        function add(parent, tag, className, text) {
+            var node = document.createElement(tag);
+            if (className) node.className = className;
+            if (text !== undefined) node.textContent = text;
+            parent.appendChild(node);
+            return node;
+        }
+        function addField(parent, label, value) {
+            var p = add(parent, 'p');
+            add(p, 'strong', null, label + ':');
+            p.appendChild(document.createTextNode(' ' + value));
+        }
+        
+        var total = data.results.length;
+        var passed = data.results.filter(function (r) { return r.status === 'PASSED'; }).length;
+        setText('generated', data.generated);
+        setText('bootstrap-servers', (data.config.kafka || {}).bootstrap_servers || 'N/A');
+        setText('total', total);
+        setText('passed', passed);
+        setText('failed', total - passed);
+        setText('pass-rate', (total ? passed / total * 100 : 0).toFixed(1) + '%');
+        
+        var results = document.getElementById('results');
+        data.results.forEach(function (r) {
+            var box = add(results, 'div', 'test-result ' + r.status.toLowerCase());
+            add(box, 'h3', null, r.status + ' - ' + r.test_name);
+            addField(box, 'Description', r.description === undefined ? 'N/A' : r.description);
+            addField(box, 'Duration', (r.duration_ms || 0).toFixed(2) + ' ms');
+            var details = add(box, 'details');
+            add(details, 'summary', null, 'Details');
+            add(details, 'pre', null, JSON.stringify(r, null, 2));
+        });
+        setText('config', JSON.stringify(data.config, null, 2));
+    })();
+    </script>
+""".encode('utf-8') + _REPORT_FOOT).split(b'{DATA}')
+
 class HTMLReporter:
     """Simple HTML report generator"""
     
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, render_in_browser: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Embed the results as JSON and let the page build the markup, instead of formatting every test here
+        self.render_in_browser = render_in_browser
     
     def generate_report(self, test_results: List[Dict[str, Any]], config: Dict[str, Any]) -> str:
         """Generate simple HTML report"""
@@ -409,29 +628,25 @@ class HTMLReporter:
         report_filename = f"kafka-e2e-report-{timestamp}.html"
         report_path = self.output_dir / report_filename
         
+        if self.render_in_browser:
+            data = _dumps({
+                'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'results': test_results,
+                'config': config
+            }, indent=False)
+            # "</" inside the blob would otherwise be able to close the <script> tag
+            with open(report_path, 'wb') as f:
+                f.write(_BROWSER_REPORT_HEAD + data.replace(b'</', b'<\\/') + _BROWSER_REPORT_TAIL)
+            return str(report_path)
+        
         # Calculate summary
         total_tests = len(test_results)
         passed_tests = sum(1 for result in test_results if result['status'] == 'PASSED')
         failed_tests = total_tests - passed_tests
         
-        # Generate simple HTML
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Kafka E2E Test Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background: #f0f0f0; padding: 20px; border-radius: 5px; }}
-        .summary {{ background: #e8f5e8; padding: 15px; margin: 20px 0; border-radius: 5px; }}
-        .test-result {{ margin: 10px 0; padding: 10px; border: 1px solid #ddd; border-radius: 5px; }}
-        .passed {{ background: #d4edda; }}
-        .failed {{ background: #f8d7da; }}
-        pre {{ background: #f8f9fa; padding: 10px; border-radius: 3px; }}
-    </style>
-</head>
-<body>
-    <div class="header">
+        # Generate simple HTML, straight into UTF-8 bytes
+        buf = bytearray(_REPORT_HEAD)
+        buf += f"""    <div class="header">
         <h1>🚀 Kafka E2E Test Report</h1>
         <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
         <p><strong>Bootstrap Servers:</strong> {config.get('kafka', {}).get('bootstrap_servers', 'N/A')}</p>
@@ -446,50 +661,38 @@ class HTMLReporter:
     </div>
     
     <h2>Test Results</h2>
-"""
+""".encode('utf-8')
         
         for result in test_results:
             status_class = result['status'].lower()
-            html_content += f"""
+            buf += f"""
     <div class="test-result {status_class}">
         <h3>{result['status']} - {result['test_name']}</h3>
         <p><strong>Description:</strong> {result.get('description', 'N/A')}</p>
         <p><strong>Duration:</strong> {result.get('duration_ms', 0):.2f} ms</p>
         <details>
             <summary>Details</summary>
-            <pre>{json.dumps(result, indent=2)}</pre>
+            <pre>""".encode('utf-8')
+            buf += _dumps(result)
+            buf += b"""</pre>
         </details>
     </div>
 """
         
-        html_content += """
+        buf += b"""
     <h2>Configuration</h2>
-    <pre>{}</pre>
-</body>
-</html>
-""".format(json.dumps(config, indent=2))
+    <pre>"""
+        buf += _dumps(config)
+        buf += b"</pre>\n"
+        buf += _REPORT_FOOT
         
-        with open(report_path, 'w') as f:
-            f.write(html_content)
+        with open(report_path, 'wb') as f:
+            f.write(buf)
         
         return str(report_path)
 '''
-    create_file("src/reports/html_reporter.py", html_reporter_content)
-    
-    # Create directories
-    dirs_to_create = [
-        "test-results",
-        "test-results/logs", 
-        "schemas",
-        "examples"
-    ]
-    
-    for dir_path in dirs_to_create:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
-        print(f"📁 Created directory: {dir_path}")
-    
-    # Create a simple requirements.txt
-    requirements_content = """# Core dependencies
+
+REQUIREMENTS_CONTENT = r"""# Core dependencies
 click>=8.0.0
 PyYAML>=6.0
 
@@ -502,10 +705,8 @@ jsonschema>=4.0.0
 # Testing with containers (optional)
 testcontainers>=3.4.0
 """
-    create_file("requirements.txt", requirements_content)
-    
-    # Create a sample config file
-    sample_config = """{
+
+SAMPLE_CONFIG_CONTENT = r"""{
   "kafka": {
     "bootstrap_servers": "localhost:9092",
     "producer": {
@@ -544,10 +745,8 @@ testcontainers>=3.4.0
     "retry_attempts": 3
   }
 }"""
-    create_file("examples/sample-config.json", sample_config)
-    
-    # Create a README for quick start
-    readme_content = """# Kafka E2E Test Tool - Quick Start
+
+README_CONTENT = r"""# Kafka E2E Test Tool - Quick Start
 
 ## Setup
 1. Run the setup: `python3 create_files.py`
@@ -585,7 +784,88 @@ python3 main.py report
 
 The tool automatically falls back to mock mode if kafka-python is not installed, and uses argparse if Click is not available.
 """
-    create_file("README.md", readme_content)
+
+
+# Directories this run has already made, so each one costs a single makedirs
+_MADE_DIRS = set()
+
+def make_dir(dir_path):
+    """Create a directory and its parents, once per run"""
+    if dir_path and dir_path not in _MADE_DIRS:
+        os.makedirs(dir_path, exist_ok=True)
+        _MADE_DIRS.add(dir_path)
+
+def create_file(filepath, content):
+    """Create a file with the given str or bytes content"""
+    make_dir(os.path.dirname(filepath))
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    # Buffered write: a bare os.write may stop short of the full content
+    with open(filepath, 'wb') as f:
+        f.write(content)
+    print(f"✅ Created: {filepath}")
+
+def main():
+    print("🚀 Setting up Kafka E2E Test Tool project structure...")
+    
+    # (path, content) pairs, written together once every directory exists
+    jobs = []
+    
+    # Create __init__.py files
+    init_files = [
+        "src/__init__.py",
+        "src/config/__init__.py", 
+        "src/kafka/__init__.py",
+        "src/validators/__init__.py",
+        "src/reports/__init__.py",
+        "src/utils/__init__.py"
+    ]
+    
+    # Every package directory in one pass, parents first
+    for package_dir in sorted({os.path.dirname(init_file) for init_file in init_files}, key=len):
+        make_dir(package_dir)
+    
+    jobs.extend((init_file, INIT_CONTENT) for init_file in init_files)
+    
+    # Create logger module
+    jobs.append(("src/utils/logger.py", LOGGER_CONTENT))
+    
+    # Create config parser module
+    jobs.append(("src/config/config_parser.py", CONFIG_PARSER_CONTENT))
+    
+    # Create kafka manager module
+    jobs.append(("src/kafka/kafka_manager.py", KAFKA_MANAGER_CONTENT))
+    
+    # Create test validator module
+    jobs.append(("src/validators/test_validator.py", TEST_VALIDATOR_CONTENT))
+    
+    # Create HTML reporter module
+    jobs.append(("src/reports/html_reporter.py", HTML_REPORTER_CONTENT))
+    
+    # Create directories
+    dirs_to_create = [
+        "test-results",
+        "test-results/logs", 
+        "schemas",
+        "examples"
+    ]
+    
+    for dir_path in dirs_to_create:
+        make_dir(dir_path)
+        print(f"📁 Created directory: {dir_path}")
+    
+    # Create a simple requirements.txt
+    jobs.append(("requirements.txt", REQUIREMENTS_CONTENT))
+    
+    # Create a sample config file
+    jobs.append(("examples/sample-config.json", SAMPLE_CONFIG_CONTENT))
+    
+    # Create a README for quick start
+    jobs.append(("README.md", README_CONTENT))
+    
+    # Writes are independent I/O, so overlap them; output order may vary
+    with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+        list(executor.map(lambda job: create_file(*job), jobs))
     
     print("\n🎉 Project setup complete!")
     print("\n📋 Next steps:")
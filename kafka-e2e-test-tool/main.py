@@ -6,18 +6,24 @@ A production-ready CLI tool for end-to-end Kafka testing
 
 import sys
 import os
+
+__version__ = '1.0.0'
+
+# Answer a bare --version before importing Click or anything else
+if len(sys.argv) == 2 and sys.argv[1] in ('--version', '-V'):
+    print(f"{os.path.basename(sys.argv[0])}, version {__version__}")
+    sys.exit(0)
+
+import importlib.util
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
 from datetime import datetime
 import argparse
 
-# Handle optional dependencies gracefully
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+# Handle optional dependencies gracefully; PyYAML is only imported when YAML is written
+HAS_YAML = importlib.util.find_spec('yaml') is not None
+if not HAS_YAML:
     print("Warning: PyYAML not installed. YAML config files not supported.")
 
 try:
@@ -26,19 +32,31 @@ try:
 except ImportError:
     HAS_CLICK = False
 
-# Local imports with error handling
-try:
-    from src.config.config_parser import ConfigParser
-    from src.kafka.kafka_manager import KafkaManager
-    from src.validators.test_validator import TestValidator
-    from src.reports.html_reporter import HTMLReporter
-    from src.utils.logger import setup_logger
-except ImportError as e:
+# Local modules are imported by the commands that use them, so --help, report and
+# generate-config never load the Kafka stack; only check here that they are present
+LOCAL_MODULES = (
+    'src.config.config_parser',
+    'src.kafka.kafka_manager',
+    'src.validators.test_validator',
+    'src.reports.html_reporter',
+    'src.utils.logger'
+)
+
+def exit_on_import_error(e):
+    """Report a missing or broken local module and stop"""
     print(f"Error importing local modules: {e}")
     print("Please ensure all source files are in the correct directory structure.")
     print("Run: mkdir -p src/config src/kafka src/validators src/reports src/utils")
     sys.exit(1)
 
+
+try:
+    for module_name in LOCAL_MODULES:
+        if importlib.util.find_spec(module_name) is None:
+            raise ImportError(f"No module named '{module_name}'")
+except ImportError as e:
+    exit_on_import_error(e)
+
 # Fallback CLI implementation without Click if not available
 class SimpleLogger:
     """Simple logger fallback"""
@@ -46,15 +64,15 @@ class SimpleLogger:
         self.name = name
         self.verbose = verbose
     
-    def info(self, msg):
+    def info(self, msg, *args):
         if self.verbose:
-            print(f"INFO: {msg}")
+            print(f"INFO: {msg % args if args else msg}")
     
-    def error(self, msg):
-        print(f"ERROR: {msg}", file=sys.stderr)
+    def error(self, msg, *args):
+        print(f"ERROR: {msg % args if args else msg}", file=sys.stderr)
     
-    def warning(self, msg):
-        print(f"WARNING: {msg}")
+    def warning(self, msg, *args):
+        print(f"WARNING: {msg % args if args else msg}")
 
 
 def setup_logger_fallback(name, verbose=False):
@@ -62,6 +80,14 @@ def setup_logger_fallback(name, verbose=False):
     return SimpleLogger(name, verbose)
 
 
+def dump_yaml(data, stream):
+    """Write data as block-style YAML"""
+    import yaml
+    # LibYAML's C emitter when PyYAML was built with it
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    yaml.dump(data, stream, Dumper=dumper, default_flow_style=False, indent=2)
+
+
 def create_minimal_config(producer_topic, consumer_topic, bootstrap_servers, messages, timeout):
     """Create minimal configuration without ConfigParser"""
     return {
@@ -120,7 +146,7 @@ def run_test_fallback(args):
             timeout=args.timeout
         )
         
-        logger.info(f"Test configuration created: {len(test_config.get('test_cases', []))} test cases")
+        logger.info("Test configuration created: %d test cases", len(test_config.get('test_cases', [])))
         
         # Simple mock implementation
         print(f"Mock test execution:")
@@ -171,7 +197,7 @@ def run_test_fallback(args):
         return 0 if failed_tests == 0 else 1
         
     except Exception as e:
-        logger.error(f"Test execution failed: {str(e)}")
+        logger.error("Test execution failed: %s", e)
         return 1
 
 
@@ -230,7 +256,7 @@ def main_fallback():
         
         with open(args.output, 'w') as f:
             if args.format == 'yaml' and HAS_YAML:
-                yaml.dump(sample_config, f, default_flow_style=False, indent=2)
+                dump_yaml(sample_config, f)
             else:
                 json.dump(sample_config, f, indent=2)
         
@@ -260,199 +286,256 @@ def main_fallback():
 
 
 if HAS_CLICK:
-    # Use Click-based CLI if available
-    @click.group()
-    @click.version_option(version='1.0.0')
-    def cli():
-        """Kafka E2E Test Tool - Validate your Kafka message flows"""
-        pass
-
-    @cli.command()
-    @click.option('--producer-topic', '-p', required=True, help='Producer topic name')
-    @click.option('--consumer-topic', '-c', required=True, help='Consumer topic name')
-    @click.option('--config', '-f', type=click.Path(exists=True), help='Test configuration file (YAML/JSON)')
-    @click.option('--bootstrap-servers', '-b', default='localhost:9092', help='Kafka bootstrap servers')
-    @click.option('--messages', '-m', multiple=True, help='Test messages (can be specified multiple times)')
-    @click.option('--output-dir', '-o', default='./test-results', help='Output directory for reports')
-    @click.option('--timeout', '-t', default=30, type=int, help='Test timeout in seconds')
-    @click.option('--use-mock', is_flag=True, help='Use mock Kafka for testing')
-    @click.option('--verbose', '-v', is_flag=True, help='Verbose logging')
-    def run_test(producer_topic: str, consumer_topic: str, config: Optional[str], 
-                 bootstrap_servers: str, messages: tuple, output_dir: str, 
-                 timeout: int, use_mock: bool, verbose: bool):
-        """Run end-to-end tests for Kafka message flows"""
+    class LazyGroup(click.Group):
+        """Click group that builds each subcommand the first time it is looked up"""
         
-        # Setup logging
-        try:
-            logger = setup_logger('kafka_e2e', verbose=verbose)
-        except:
-            logger = setup_logger_fallback('kafka_e2e', verbose)
+        def __init__(self, *args, lazy_subcommands: Optional[Dict[str, Any]] = None, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Command name -> factory returning the click.Command
+            self.lazy_subcommands = lazy_subcommands or {}
         
-        logger.info("Starting Kafka E2E Test Tool")
+        def list_commands(self, ctx):
+            return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
         
-        try:
-            # Create output directory
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
+        def get_command(self, ctx, cmd_name):
+            if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+                self.add_command(self.lazy_subcommands[cmd_name](), cmd_name)
+            return super().get_command(ctx, cmd_name)
+
+    def make_run_test_command():
+        """Build the run-test command"""
+        @click.command('run-test')
+        @click.option('--producer-topic', '-p', required=True, help='Producer topic name')
+        @click.option('--consumer-topic', '-c', required=True, help='Consumer topic name')
+        @click.option('--config', '-f', type=click.Path(exists=True), help='Test configuration file (YAML/JSON)')
+        @click.option('--bootstrap-servers', '-b', default='localhost:9092', help='Kafka bootstrap servers')
+        @click.option('--messages', '-m', multiple=True, help='Test messages (can be specified multiple times)')
+        @click.option('--output-dir', '-o', default='./test-results', help='Output directory for reports')
+        @click.option('--timeout', '-t', default=30, type=int, help='Test timeout in seconds')
+        @click.option('--use-mock', is_flag=True, help='Use mock Kafka for testing')
+        @click.option('--verbose', '-v', is_flag=True, help='Verbose logging')
+        @click.option('--browser-report', is_flag=True, help='Render the HTML report in the browser from embedded JSON')
+        def run_test(producer_topic: str, consumer_topic: str, config: Optional[str], 
+                     bootstrap_servers: str, messages: tuple, output_dir: str, 
+                     timeout: int, use_mock: bool, verbose: bool, browser_report: bool):
+            """Run end-to-end tests for Kafka message flows"""
             
-            # Parse configuration
+            # Import here rather than at startup, but a module that fails to import still stops the run
             try:
-                config_parser = ConfigParser()
-                if config:
-                    test_config = config_parser.load_config(config)
-                else:
-                    # Create default config from CLI arguments
-                    test_config = config_parser.create_default_config(
+                from src.config.config_parser import ConfigParser
+                from src.kafka.kafka_manager import KafkaManager
+                from src.validators.test_validator import TestValidator
+                from src.reports.html_reporter import HTMLReporter
+                from src.utils.logger import setup_logger
+            except ImportError as e:
+                exit_on_import_error(e)
+            
+            # Setup logging
+            try:
+                logger = setup_logger('kafka_e2e', verbose=verbose)
+            except:
+                logger = setup_logger_fallback('kafka_e2e', verbose)
+            
+            logger.info("Starting Kafka E2E Test Tool")
+            
+            try:
+                # Create output directory
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+                
+                # Parse configuration
+                try:
+                    config_parser = ConfigParser()
+                    if config:
+                        test_config = config_parser.load_config(config)
+                    else:
+                        # Create default config from CLI arguments
+                        test_config = config_parser.create_default_config(
+                            producer_topic=producer_topic,
+                            consumer_topic=consumer_topic,
+                            bootstrap_servers=bootstrap_servers,
+                            messages=list(messages) if messages else ["Hello Kafka!", "Test Message 2"],
+                            timeout=timeout
+                        )
+                except:
+                    # Fallback to simple config
+                    test_config = create_minimal_config(
                         producer_topic=producer_topic,
                         consumer_topic=consumer_topic,
                         bootstrap_servers=bootstrap_servers,
                         messages=list(messages) if messages else ["Hello Kafka!", "Test Message 2"],
                         timeout=timeout
                     )
-            except:
-                # Fallback to simple config
-                test_config = create_minimal_config(
-                    producer_topic=producer_topic,
-                    consumer_topic=consumer_topic,
-                    bootstrap_servers=bootstrap_servers,
-                    messages=list(messages) if messages else ["Hello Kafka!", "Test Message 2"],
-                    timeout=timeout
-                )
-            
-            logger.info(f"Test configuration loaded: {len(test_config.get('test_cases', []))} test cases")
-            
-            # Initialize Kafka manager
-            try:
+                
+                logger.info("Test configuration loaded: %d test cases", len(test_config.get('test_cases', [])))
+                
+                # Initialize Kafka manager; a producer that cannot be created fails the run
+                # rather than falling through to the mock execution below
                 kafka_manager = KafkaManager(
                     bootstrap_servers=test_config['kafka']['bootstrap_servers'],
-                    use_mock=use_mock
+                    use_mock=use_mock,
+                    producer_config=test_config['kafka'].get('producer', {}).get('config')
                 )
                 
-                # Initialize test validator
-                validator = TestValidator(kafka_manager)
+                try:
+                    # Initialize test validator
+                    validator = TestValidator(kafka_manager)
+                    
+                    # Run tests
+                    test_results = validator.run_all_tests(test_config)
+                    
+                    # Generate HTML report
+                    reporter = HTMLReporter(output_dir, render_in_browser=browser_report)
+                    report_path = reporter.generate_report(test_results, test_config)
+                    
+                except Exception as e:
+                    logger.warning("Full test execution failed: %s. Running in mock mode.", e)
+                    # Fallback to simple mock execution
+                    test_results = [
+                        {
+                            'test_name': 'basic_test',
+                            'status': 'PASSED',
+                            'description': 'Mock test execution',
+                            'start_time': datetime.now().isoformat(),
+                            'end_time': datetime.now().isoformat(),
+                            'duration_ms': 100.0,
+                            'validation_results': {},
+                            'errors': []
+                        }
+                    ]
+                    report_path = Path(output_dir) / f"mock-report-{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+                    with open(report_path, 'w') as f:
+                        f.write("Mock test execution completed successfully\n")
+                
+                # Print summary
+                total_tests = len(test_results)
+                passed_tests = sum(1 for result in test_results if result['status'] == 'PASSED')
+                failed_tests = total_tests - passed_tests
                 
-                # Run tests
-                test_results = validator.run_all_tests(test_config)
+                click.echo(f"\n{'='*50}")
+                click.echo(f"TEST SUMMARY")
+                click.echo(f"{'='*50}")
+                click.echo(f"Total Tests: {total_tests}")
+                click.echo(f"Passed: {click.style(str(passed_tests), fg='green')}")
+                click.echo(f"Failed: {click.style(str(failed_tests), fg='red')}")
+                click.echo(f"Report generated: {report_path}")
+                click.echo(f"{'='*50}")
                 
-                # Generate HTML report
-                reporter = HTMLReporter(output_dir)
-                report_path = reporter.generate_report(test_results, test_config)
+                # Exit with appropriate code
+                sys.exit(0 if failed_tests == 0 else 1)
                 
             except Exception as e:
-                logger.warning(f"Full test execution failed: {e}. Running in mock mode.")
-                # Fallback to simple mock execution
-                test_results = [
-                    {
-                        'test_name': 'basic_test',
-                        'status': 'PASSED',
-                        'description': 'Mock test execution',
-                        'start_time': datetime.now().isoformat(),
-                        'end_time': datetime.now().isoformat(),
-                        'duration_ms': 100.0,
-                        'validation_results': {},
-                        'errors': []
-                    }
-                ]
-                report_path = Path(output_dir) / f"mock-report-{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                with open(report_path, 'w') as f:
-                    f.write("Mock test execution completed successfully\n")
+                logger.error("Test execution failed: %s", e)
+                click.echo(f"Error: {str(e)}", err=True)
+                sys.exit(1)
+            finally:
+                if 'kafka_manager' in locals():
+                    try:
+                        kafka_manager.cleanup()
+                    except:
+                        pass
+
+        return run_test
+
+    def make_generate_config_command():
+        """Build the generate-config command"""
+        @click.command('generate-config')
+        @click.option('--output', '-o', default='kafka-test-config.yaml', help='Output config file path')
+        @click.option('--format', '-f', type=click.Choice(['yaml', 'json']), default='yaml', help='Config file format')
+        @click.option('--producer-topic', '-p', default='test-producer-topic', help='Default producer topic')
+        @click.option('--consumer-topic', '-c', default='test-consumer-topic', help='Default consumer topic')
+        def generate_config(output: str, format: str, producer_topic: str, consumer_topic: str):
+            """Generate a sample configuration file"""
             
-            # Print summary
-            total_tests = len(test_results)
-            passed_tests = sum(1 for result in test_results if result['status'] == 'PASSED')
-            failed_tests = total_tests - passed_tests
+            try:
+                from src.config.config_parser import ConfigParser
+            except ImportError as e:
+                exit_on_import_error(e)
             
-            click.echo(f"\n{'='*50}")
-            click.echo(f"TEST SUMMARY")
-            click.echo(f"{'='*50}")
-            click.echo(f"Total Tests: {total_tests}")
-            click.echo(f"Passed: {click.style(str(passed_tests), fg='green')}")
-            click.echo(f"Failed: {click.style(str(failed_tests), fg='red')}")
-            click.echo(f"Report generated: {report_path}")
-            click.echo(f"{'='*50}")
+            sample_text = None
+            try:
+                config_parser = ConfigParser()
+                if format == 'json':
+                    # Already rendered at import, only the topics are filled in
+                    sample_text = config_parser.generate_sample_config_json(producer_topic, consumer_topic)
+                else:
+                    sample_config = config_parser.generate_sample_config(
+                        producer_topic=producer_topic,
+                        consumer_topic=consumer_topic,
+                        format=format
+                    )
+            except:
+                # Fallback sample config
+                sample_config = {
+                    "kafka": {
+                        "bootstrap_servers": "localhost:9092",
+                        "producer": {"topic": producer_topic},
+                        "consumer": {"topic": consumer_topic}
+                    },
+                    "test_cases": [{
+                        "name": "sample_test",
+                        "enabled": True,
+                        "messages": ["Hello Kafka!"],
+                        "validations": ["delivery"]
+                    }]
+                }
             
-            # Exit with appropriate code
-            sys.exit(0 if failed_tests == 0 else 1)
+            # Write to file
+            with open(output, 'w') as f:
+                if sample_text is not None:
+                    f.write(sample_text)
+                elif format == 'yaml' and HAS_YAML:
+                    dump_yaml(sample_config, f)
+                else:
+                    json.dump(sample_config, f, indent=2)
             
-        except Exception as e:
-            logger.error(f"Test execution failed: {str(e)}")
-            click.echo(f"Error: {str(e)}", err=True)
-            sys.exit(1)
-        finally:
-            if 'kafka_manager' in locals():
-                try:
-                    kafka_manager.cleanup()
-                except:
-                    pass
-
-    @cli.command()
-    @click.option('--output', '-o', default='kafka-test-config.yaml', help='Output config file path')
-    @click.option('--format', '-f', type=click.Choice(['yaml', 'json']), default='yaml', help='Config file format')
-    @click.option('--producer-topic', '-p', default='test-producer-topic', help='Default producer topic')
-    @click.option('--consumer-topic', '-c', default='test-consumer-topic', help='Default consumer topic')
-    def generate_config(output: str, format: str, producer_topic: str, consumer_topic: str):
-        """Generate a sample configuration file"""
-        
-        try:
-            config_parser = ConfigParser()
-            sample_config = config_parser.generate_sample_config(
-                producer_topic=producer_topic,
-                consumer_topic=consumer_topic,
-                format=format
-            )
-        except:
-            # Fallback sample config
-            sample_config = {
-                "kafka": {
-                    "bootstrap_servers": "localhost:9092",
-                    "producer": {"topic": producer_topic},
-                    "consumer": {"topic": consumer_topic}
-                },
-                "test_cases": [{
-                    "name": "sample_test",
-                    "enabled": True,
-                    "messages": ["Hello Kafka!"],
-                    "validations": ["delivery"]
-                }]
-            }
-        
-        # Write to file
-        with open(output, 'w') as f:
-            if format == 'yaml' and HAS_YAML:
-                yaml.dump(sample_config, f, default_flow_style=False, indent=2)
+            click.echo(f"Sample configuration generated: {output}")
+
+        return generate_config
+
+    def make_report_command():
+        """Build the report command"""
+        @click.command('report')
+        @click.option('--report-dir', '-d', default='./test-results', help='Directory containing test reports')
+        @click.option('--format', '-f', type=click.Choice(['summary', 'detailed']), default='summary', help='Report format')
+        def report(report_dir: str, format: str):
+            """Display test report summary"""
+            
+            report_dir_path = Path(report_dir)
+            if not report_dir_path.exists():
+                click.echo(f"Report directory not found: {report_dir}", err=True)
+                sys.exit(1)
+            
+            # Find latest HTML report
+            html_files = list(report_dir_path.glob("kafka-e2e-report-*.html"))
+            txt_files = list(report_dir_path.glob("*report*.txt"))
+            all_files = html_files + txt_files
+            
+            if not all_files:
+                click.echo("No test reports found", err=True)
+                sys.exit(1)
+            
+            latest_report = max(all_files, key=lambda x: x.stat().st_mtime)
+            
+            if format == 'summary':
+                click.echo(f"Latest report: {latest_report}")
+                click.echo(f"Generated: {datetime.fromtimestamp(latest_report.stat().st_mtime)}")
             else:
-                json.dump(sample_config, f, indent=2)
-        
-        click.echo(f"Sample configuration generated: {output}")
+                # For detailed format, we would parse the HTML or have a JSON summary
+                click.echo(f"Detailed report available at: {latest_report}")
+                click.echo("Open in browser to view detailed results")
 
-    @cli.command()
-    @click.option('--report-dir', '-d', default='./test-results', help='Directory containing test reports')
-    @click.option('--format', '-f', type=click.Choice(['summary', 'detailed']), default='summary', help='Report format')
-    def report(report_dir: str, format: str):
-        """Display test report summary"""
-        
-        report_dir_path = Path(report_dir)
-        if not report_dir_path.exists():
-            click.echo(f"Report directory not found: {report_dir}", err=True)
-            sys.exit(1)
-        
-        # Find latest HTML report
-        html_files = list(report_dir_path.glob("kafka-e2e-report-*.html"))
-        txt_files = list(report_dir_path.glob("*report*.txt"))
-        all_files = html_files + txt_files
-        
-        if not all_files:
-            click.echo("No test reports found", err=True)
-            sys.exit(1)
-        
-        latest_report = max(all_files, key=lambda x: x.stat().st_mtime)
-        
-        if format == 'summary':
-            click.echo(f"Latest report: {latest_report}")
-            click.echo(f"Generated: {datetime.fromtimestamp(latest_report.stat().st_mtime)}")
-        else:
-            # For detailed format, we would parse the HTML or have a JSON summary
-            click.echo(f"Detailed report available at: {latest_report}")
-            click.echo("Open in browser to view detailed results")
+        return report
+
+    # Use Click-based CLI if available; commands are only built when invoked or listed
+    @click.group(cls=LazyGroup, lazy_subcommands={
+        'run-test': make_run_test_command,
+        'generate-config': make_generate_config_command,
+        'report': make_report_command
+    })
+    @click.version_option(__version__, '--version', '-V')
+    def cli():
+        """Kafka E2E Test Tool - Validate your Kafka message flows"""
+        pass
 
 
 if __name__ == '__main__':
@@ -1,12 +1,85 @@
+import copy
+import importlib.util
 import json
+import os
+import stat
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List
 
+# PyYAML is only imported once a YAML file actually needs parsing
+HAS_YAML = importlib.util.find_spec('yaml') is not None
+
 try:
-    import yaml
-    HAS_YAML = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_YAML = False
+    HAS_ORJSON = False
+
+def _parse_yaml(path: Path) -> Any:
+    """Parse a YAML file"""
+    import yaml
+    # LibYAML's C loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=loader)
+
+def _parse_json(path: Path) -> Any:
+    """Parse a JSON file"""
+    if HAS_ORJSON:
+        data = path.read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The json module also takes NaN/Infinity and integers past 64 bits
+            return json.loads(data)
+    
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _write_json_sidecar(sidecar: Path, source: Path, source_key: Dict[str, int], data: Any):
+    """Save parsed YAML as JSON so later runs can skip the YAML parser"""
+    try:
+        content = json.dumps({'source': source_key, 'config': data})
+        # Only keep sidecars that load back to the same data (no dates, non-string keys, ...)
+        if json.loads(content)['config'] != data:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+            # mkstemp creates the file 0600; readable by whoever can read the YAML instead
+            os.chmod(tmp_path, stat.S_IMODE(source.stat().st_mode))
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except (TypeError, ValueError, OSError):
+        pass
+
+@lru_cache(maxsize=128)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime, size); an edited file gets a new key"""
+    config_file = Path(path)
+    if config_file.suffix.lower() in ['.yaml', '.yml']:
+        # config.yaml.json holds the last parse together with the mtime and size of the YAML it came
+        # from; only an exact match is trusted, since restored or quickly re-edited files defeat ordering
+        sidecar = config_file.with_name(config_file.name + '.json')
+        source_key = {'mtime_ns': mtime_ns, 'size': size}
+        try:
+            cached = _parse_json(sidecar)
+            if isinstance(cached, dict) and cached.get('source') == source_key and 'config' in cached:
+                return cached['config']
+        except (OSError, ValueError):
+            pass
+        
+        if HAS_YAML:
+            data = _parse_yaml(config_file)
+            _write_json_sidecar(sidecar, config_file, source_key, data)
+            return data
+    
+    return _parse_json(config_file)
 
 class ConfigParser:
     """Simple configuration parser"""
@@ -18,11 +91,9 @@ class ConfigParser:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_file, 'r') as f:
-            if config_file.suffix.lower() in ['.yaml', '.yml'] and HAS_YAML:
-                return yaml.safe_load(f)
-            else:
-                return json.load(f)
+        st = config_file.stat()
+        # Callers get their own copy, so changes to it never leak into the cache
+        return copy.deepcopy(_load_cached(str(config_file.resolve()), st.st_mtime_ns, st.st_size))
     
     def create_default_config(self, producer_topic: str, consumer_topic: str, 
                             bootstrap_servers: str, messages: List[str], 
@@ -94,3 +165,14 @@ class ConfigParser:
                 "allow_duplicates": False
             }
         }
+    
+    def generate_sample_config_json(self, producer_topic: str, consumer_topic: str) -> str:
+        """Generate sample configuration as indented JSON text"""
+        head, middle, tail = _SAMPLE_CONFIG_PARTS
+        return head + json.dumps(producer_topic) + middle + json.dumps(consumer_topic) + tail
+
+# Sample config serialized once at import, split around the producer and consumer topics
+_TOPIC_PLACEHOLDER = '\0topic'
+_SAMPLE_CONFIG_PARTS = tuple(json.dumps(
+    ConfigParser().generate_sample_config(_TOPIC_PLACEHOLDER, _TOPIC_PLACEHOLDER), indent=2
+).split(json.dumps(_TOPIC_PLACEHOLDER)))
@@ -7,8 +7,10 @@ from dataclasses import dataclass
 @dataclass
 class KafkaMessage:
     """Represents a Kafka message"""
+    __slots__ = ('key', 'value', 'topic', 'partition', 'offset', 'timestamp', 'headers')
+    
     key: Optional[str]
-    value: str
+    value: bytes  # UTF-8, as it travels on the wire
     topic: str
     partition: int
     offset: int
@@ -21,17 +23,22 @@ class MockKafkaManager:
     def __init__(self):
         self.messages = {}
         self.consumers = {}
+        # Next offset per topic, kept apart from the buffer so offsets don't depend on what it still holds
+        self.offsets = {}
     
     def produce_message(self, topic: str, message: str, key: Optional[str] = None) -> bool:
         if topic not in self.messages:
             self.messages[topic] = []
         
+        offset = self.offsets.get(topic, 0)
+        self.offsets[topic] = offset + 1
+        
         kafka_msg = KafkaMessage(
             key=key,
-            value=message,
+            value=message.encode('utf-8'),
             topic=topic,
             partition=0,
-            offset=len(self.messages[topic]),
+            offset=offset,
             timestamp=datetime.now(),
             headers={}
         )
@@ -39,26 +46,58 @@ class MockKafkaManager:
         self.messages[topic].append(kafka_msg)
         return True
     
+    def produce_messages(self, topic: str, messages: List[str]) -> int:
+        """Append a whole batch at once with one shared timestamp"""
+        buf = self.messages.setdefault(topic, [])
+        base = self.offsets.get(topic, 0)
+        self.offsets[topic] = base + len(messages)
+        timestamp = datetime.now()
+        buf.extend(KafkaMessage(key=None, value=message.encode('utf-8'), topic=topic, partition=0,
+                                offset=base + i, timestamp=timestamp, headers={})
+                   for i, message in enumerate(messages))
+        return len(messages)
+    
     def consume_messages(self, topic: str, timeout: int = 30):
         if topic not in self.consumers:
             self.consumers[topic] = 0
         
         if topic in self.messages:
-            available_messages = self.messages[topic][self.consumers[topic]:]
-            for msg in available_messages:
-                self.consumers[topic] += 1
-                yield msg
+            # Walk forward from the cursor instead of copying the unread tail on every poll
+            buf = self.messages[topic]
+            for index in range(self.consumers[topic], len(buf)):
+                self.consumers[topic] = index + 1
+                yield buf[index]
     
     def reset_topic(self, topic: str):
         if topic in self.messages:
             self.messages[topic] = []
         if topic in self.consumers:
             self.consumers[topic] = 0
+        self.offsets.pop(topic, None)
+
+# kafka-python producer settings applied unless producer_config overrides them:
+# linger briefly so batched sends fill larger requests
+_PRODUCER_DEFAULTS = {'linger_ms': 10, 'batch_size': 65536}
+
+def _producer_settings(producer_config: Optional[Dict[str, Any]], known: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a config's producer settings into KafkaProducer keyword arguments"""
+    settings = dict(_PRODUCER_DEFAULTS)
+    for key, value in (producer_config or {}).items():
+        # Java client spelling (linger.ms) maps onto kafka-python's (linger_ms)
+        name = key.replace('.', '_')
+        if name == 'bootstrap_servers':
+            continue  # Taken from kafka.bootstrap_servers
+        if name not in known:
+            print(f"Warning: ignoring unsupported producer setting '{key}'")
+            continue
+        settings[name] = value
+    return settings
 
 class KafkaManager:
     """Kafka manager with mock support"""
     
-    def __init__(self, bootstrap_servers: str, use_mock: bool = False):
+    def __init__(self, bootstrap_servers: str, use_mock: bool = False,
+                 producer_config: Optional[Dict[str, Any]] = None):
         self.bootstrap_servers = bootstrap_servers
         self.use_mock = use_mock
         
@@ -69,10 +108,8 @@ class KafkaManager:
             try:
                 # Try to import kafka-python
                 from kafka import KafkaProducer, KafkaConsumer
-                self.producer = KafkaProducer(
-                    bootstrap_servers=bootstrap_servers,
-                    value_serializer=lambda v: v.encode('utf-8')
-                )
+                self.producer = KafkaProducer(bootstrap_servers=bootstrap_servers,
+                                              **_producer_settings(producer_config, KafkaProducer.DEFAULT_CONFIG))
             except ImportError:
                 print("Warning: kafka-python not installed. Using mock mode.")
                 self.use_mock = True
@@ -83,7 +120,7 @@ class KafkaManager:
             return self.mock_manager.produce_message(topic, message, key)
         
         try:
-            future = self.producer.send(topic, value=message, key=key)
+            future = self.producer.send(topic, value=message.encode('utf-8'), key=key)
             future.get(timeout=10)
             return True
         except Exception as e:
@@ -91,21 +128,32 @@ class KafkaManager:
             return False
     
     def produce_messages_batch(self, topic: str, messages: List[str]) -> Dict[str, Any]:
-        start_time = time.time()
-        success_count = 0
+        start_ns = time.perf_counter_ns()
         
-        for message in messages:
-            if self.produce_message(topic, message):
-                success_count += 1
+        if self.use_mock:
+            success_count = self.mock_manager.produce_messages(topic, messages)
+        else:
+            # Queue every send first and wait once, instead of blocking on each message
+            futures = []
+            for message in messages:
+                try:
+                    futures.append(self.producer.send(topic, value=message.encode('utf-8')))
+                except Exception as e:
+                    print(f"Failed to produce message: {e}")
+            try:
+                self.producer.flush(timeout=10)
+            except Exception as e:
+                print(f"Failed to flush messages: {e}")
+            success_count = sum(1 for future in futures if future.succeeded())
         
-        end_time = time.time()
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         
         return {
             'total_messages': len(messages),
             'success_count': success_count,
             'failed_count': len(messages) - success_count,
-            'duration_seconds': end_time - start_time,
-            'messages_per_second': len(messages) / (end_time - start_time) if end_time > start_time else 0
+            'duration_seconds': duration,
+            'messages_per_second': len(messages) / duration if duration > 0 else 0
         }
     
     def consume_messages(self, topic: str, timeout: int = 30, max_messages: Optional[int] = None) -> List[KafkaMessage]:
@@ -3,12 +3,118 @@ from typing import List, Dict, Any
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj as UTF-8 JSON, with orjson when it can encode it"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+_REPORT_STYLE = """    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background: #f0f0f0; padding: 20px; border-radius: 5px; }
+        .summary { background: #e8f5e8; padding: 15px; margin: 20px 0; border-radius: 5px; }
+        .test-result { margin: 10px 0; padding: 10px; border: 1px solid #ddd; border-radius: 5px; }
+        .passed { background: #d4edda; }
+        .failed { background: #f8d7da; }
+        pre { background: #f8f9fa; padding: 10px; border-radius: 3px; }
+    </style>
+"""
+
+# Static document head and foot, encoded once and shared by both report layouts
+_REPORT_HEAD = ("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Kafka E2E Test Report</title>
+""" + _REPORT_STYLE + """</head>
+<body>
+""").encode('utf-8')
+_REPORT_FOOT = b"""</body>
+</html>
+"""
+
+# Static page that renders the report from one embedded JSON blob in the browser
+_BROWSER_REPORT_HEAD, _BROWSER_REPORT_TAIL = (_REPORT_HEAD + """    <div class="header">
+        <h1>🚀 Kafka E2E Test Report</h1>
+        <p><strong>Generated:</strong> <span id="generated"></span></p>
+        <p><strong>Bootstrap Servers:</strong> <span id="bootstrap-servers"></span></p>
+    </div>
+    
+    <div class="summary">
+        <h2>Summary</h2>
+        <p><strong>Total Tests:</strong> <span id="total"></span></p>
+        <p><strong>Passed:</strong> <span id="passed"></span></p>
+        <p><strong>Failed:</strong> <span id="failed"></span></p>
+        <p><strong>Pass Rate:</strong> <span id="pass-rate"></span></p>
+    </div>
+    
+    <h2>Test Results</h2>
+    <div id="results"></div>
+    
+    <h2>Configuration</h2>
+    <pre id="config"></pre>
+    
+    <script>window.__DATA__ = {DATA};</script>
+    <script>
+    (function () {
+        var data = window.__DATA__;
+        function setText(id, value) { document.getElementById(id).textContent = value; }
+        function add(parent, tag, className, text) {
+            var node = document.createElement(tag);
+            if (className) node.className = className;
+            if (text !== undefined) node.textContent = text;
+            parent.appendChild(node);
+            return node;
+        }
+        function addField(parent, label, value) {
+            var p = add(parent, 'p');
+            add(p, 'strong', null, label + ':');
+            p.appendChild(document.createTextNode(' ' + value));
+        }
+        
+        var total = data.results.length;
+        var passed = data.results.filter(function (r) { return r.status === 'PASSED'; }).length;
+        setText('generated', data.generated);
+        setText('bootstrap-servers', (data.config.kafka || {}).bootstrap_servers || 'N/A');
+        setText('total', total);
+        setText('passed', passed);
+        setText('failed', total - passed);
+        setText('pass-rate', (total ? passed / total * 100 : 0).toFixed(1) + '%');
+        
+        var results = document.getElementById('results');
+        data.results.forEach(function (r) {
+            var box = add(results, 'div', 'test-result ' + r.status.toLowerCase());
+            add(box, 'h3', null, r.status + ' - ' + r.test_name);
+            addField(box, 'Description', r.description === undefined ? 'N/A' : r.description);
+            addField(box, 'Duration', (r.duration_ms || 0).toFixed(2) + ' ms');
+            var details = add(box, 'details');
+            add(details, 'summary', null, 'Details');
+            add(details, 'pre', null, JSON.stringify(r, null, 2));
+        });
+        setText('config', JSON.stringify(data.config, null, 2));
+    })();
+    </script>
+""".encode('utf-8') + _REPORT_FOOT).split(b'{DATA}')
+
 class HTMLReporter:
     """Simple HTML report generator"""
     
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, render_in_browser: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Embed the results as JSON and let the page build the markup, instead of formatting every test here
+        self.render_in_browser = render_in_browser
     
     def generate_report(self, test_results: List[Dict[str, Any]], config: Dict[str, Any]) -> str:
         """Generate simple HTML report"""
@@ -16,29 +122,25 @@ class HTMLReporter:
         report_filename = f"kafka-e2e-report-{timestamp}.html"
         report_path = self.output_dir / report_filename
         
+        if self.render_in_browser:
+            data = _dumps({
+                'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'results': test_results,
+                'config': config
+            }, indent=False)
+            # "</" inside the blob would otherwise be able to close the <script> tag
+            with open(report_path, 'wb') as f:
+                f.write(_BROWSER_REPORT_HEAD + data.replace(b'</', b'<\\/') + _BROWSER_REPORT_TAIL)
+            return str(report_path)
+        
         # Calculate summary
         total_tests = len(test_results)
         passed_tests = sum(1 for result in test_results if result['status'] == 'PASSED')
         failed_tests = total_tests - passed_tests
         
-        # Generate simple HTML
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Kafka E2E Test Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background: #f0f0f0; padding: 20px; border-radius: 5px; }}
-        .summary {{ background: #e8f5e8; padding: 15px; margin: 20px 0; border-radius: 5px; }}
-        .test-result {{ margin: 10px 0; padding: 10px; border: 1px solid #ddd; border-radius: 5px; }}
-        .passed {{ background: #d4edda; }}
-        .failed {{ background: #f8d7da; }}
-        pre {{ background: #f8f9fa; padding: 10px; border-radius: 3px; }}
-    </style>
-</head>
-<body>
-    <div class="header">
+        # Generate simple HTML, straight into UTF-8 bytes
+        buf = bytearray(_REPORT_HEAD)
+        buf += f"""    <div class="header">
         <h1>🚀 Kafka E2E Test Report</h1>
         <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
         <p><strong>Bootstrap Servers:</strong> {config.get('kafka', {}).get('bootstrap_servers', 'N/A')}</p>
@@ -53,30 +155,32 @@ class HTMLReporter:
     </div>
     
     <h2>Test Results</h2>
-"""
+""".encode('utf-8')
         
         for result in test_results:
             status_class = result['status'].lower()
-            html_content += f"""
+            buf += f"""
     <div class="test-result {status_class}">
         <h3>{result['status']} - {result['test_name']}</h3>
         <p><strong>Description:</strong> {result.get('description', 'N/A')}</p>
         <p><strong>Duration:</strong> {result.get('duration_ms', 0):.2f} ms</p>
         <details>
             <summary>Details</summary>
-            <pre>{json.dumps(result, indent=2)}</pre>
+            <pre>""".encode('utf-8')
+            buf += _dumps(result)
+            buf += b"""</pre>
         </details>
     </div>
 """
         
-        html_content += """
+        buf += b"""
     <h2>Configuration</h2>
-    <pre>{}</pre>
-</body>
-</html>
-""".format(json.dumps(config, indent=2))
+    <pre>"""
+        buf += _dumps(config)
+        buf += b"</pre>\n"
+        buf += _REPORT_FOOT
         
-        with open(report_path, 'w') as f:
-            f.write(html_content)
+        with open(report_path, 'wb') as f:
+            f.write(buf)
         
         return str(report_path)
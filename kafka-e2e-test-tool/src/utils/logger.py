@@ -14,6 +14,7 @@ def setup_logger(name: str, log_file=None, verbose: bool = False):
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
+    # Pass values as arguments (logger.info('%s', value)) so records below the level are never formatted
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)